@@ -0,0 +1,114 @@
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+from standin import FIXTURES_DIR, FixtureStore, StandIn
+from stages import TASKS
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+STAGES = os.path.join(HERE, "stages.py")
+BASELINE_PATH = os.path.join(HERE, "baseline.json")
+RESULTS_PATH = os.path.join(HERE, "results.json")
+
+
+def run_task(task: str, standin: StandIn, repeat: int, stage_args: list[str]) -> dict:
+    """
+    Run one tool's stages in a fresh process and scratch directory; {stage: {"median", "min", "runs"}}.
+    """
+    with tempfile.TemporaryDirectory(prefix=f"bench-{task}-") as work:
+        out = os.path.join(work, "timings.json")
+        cmd = [sys.executable, STAGES, task, "--standin", standin.base, "--repeat", str(repeat), "--out", out]
+        env = dict(os.environ, PYTHONPATH=HERE + os.pathsep + os.environ.get("PYTHONPATH", ""))
+        proc = subprocess.run(cmd + stage_args, cwd=work, env=env, stdout=subprocess.DEVNULL)
+        if proc.returncode != 0 or not os.path.exists(out):
+            raise RuntimeError(f"{task} stages failed (exit code {proc.returncode})")
+        with open(out, encoding="utf-8") as f:
+            return json.load(f)
+
+
+def compare(results: dict, baseline: dict, threshold: float) -> list[tuple]:
+    """
+    [(stage, median, baseline median or None, relative change or None, verdict)] for every stage.
+    """
+    rows = []
+    old_stages = baseline.get("stages", {}) if baseline else {}
+    for stage, t in results["stages"].items():
+        old = old_stages.get(stage)
+        if not old or not old["median"]:
+            rows.append((stage, t["median"], None, None, "new"))
+            continue
+        change = (t["median"] - old["median"]) / old["median"]
+        verdict = "slower" if change > threshold else "faster" if change < -threshold else "same"
+        rows.append((stage, t["median"], old["median"], change, verdict))
+    return rows
+
+
+def print_table(rows: list[tuple]):
+    print(f"{'stage':32} {'median':>10} {'baseline':>10} {'change':>8}")
+    for stage, median, old, change, verdict in rows:
+        old_s = f"{old * 1000:8.1f}ms" if old is not None else f"{'-':>10}"
+        change_s = f"{change:+7.1%}" if change is not None else f"{'':>7}"
+        flag = {"slower": "  ❌ slower", "faster": "  ✅ faster"}.get(verdict, "")
+        print(f"{stage:32} {median * 1000:8.1f}ms {old_s} {change_s}{flag}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline record/replay benchmarks for the three tools")
+    parser.add_argument("mode", choices=["record", "run"],
+                        help="record: run once against the live endpoints and save fixtures; run: replay and time")
+    parser.add_argument("--tasks", nargs="+", choices=sorted(TASKS), default=sorted(TASKS))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--fixtures", default=FIXTURES_DIR)
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline results to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.10, help="relative change reported as slower/faster")
+    parser.add_argument("--strict", action="store_true", help="exit with status 1 if any stage got slower")
+    parser.add_argument("--out", default=RESULTS_PATH)
+    args, stage_args = parser.parse_known_args()
+
+    store = FixtureStore(args.fixtures)
+    mode = "record" if args.mode == "record" else "replay"
+    repeat = 1 if mode == "record" else args.repeat
+
+    results = {"meta": {"python": platform.python_version(), "platform": platform.platform(),
+                        "cpus": os.cpu_count(), "repeat": repeat, "stage_args": stage_args,
+                        "created_at": time.time()},
+               "stages": {}}
+    with StandIn(mode, store) as standin:
+        for task in args.tasks:
+            print(f"⏱️ {task} ...", flush=True)
+            for stage, t in run_task(task, standin, repeat, stage_args).items():
+                results["stages"][f"{task}.{stage}"] = t
+
+    if mode == "record":
+        print(f"✅ Recorded {len(store.index)} responses into {args.fixtures}")
+        return
+    if standin.misses:
+        print(f"⚠️ {len(standin.misses)} requests had no fixture (run `bench.py record` first), e.g. {standin.misses[0]}")
+
+    baseline = None
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    if baseline and baseline.get("meta", {}).get("stage_args") != stage_args:
+        print("⚠️ Baseline was recorded with different stage options:", baseline.get("meta", {}).get("stage_args"))
+    rows = compare(results, baseline, args.threshold)
+    print_table(rows)
+
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2)
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print("✅ Baseline saved to:", args.baseline)
+    if args.strict and any(r[4] == "slower" for r in rows):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+"""
+Per-stage timings for one tool, run in its own process (the three task folders reuse module
+names like app.py / batch.py, so they cannot share an interpreter). bench.py starts this with
+a scratch working directory, so every run begins with empty output/ caches.
+
+    python stages.py task2 --standin http://127.0.0.1:8765 --repeat 3 --out timings.json
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import sys
+import time
+
+from standin import route_requests_through, to_local
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+TASK_DIRS = {
+    "task1": os.path.join(ROOT, "task1-ai-video"),
+    "task2": os.path.join(ROOT, "task2-seo-blog-generator"),
+    "task3": os.path.join(ROOT, "task3-architecture"),
+}
+
+REQUIREMENTS = [
+    "Build a customer support chatbot that answers FAQs",
+    "Online store with cart, checkout and card payments",
+    "Hospital patient appointment booking with billing",
+    "HR portal for employee leave, payroll and an analytics dashboard",
+    "Food delivery app with live courier tracking",
+    "Learning platform with courses, quizzes and student progress",
+    "IoT telemetry ingestion for smart home sensors",
+    "Internal tool to track office plants",
+]
+
+
+class Timer:
+    def __init__(self, repeat: int):
+        self.repeat = repeat
+        self.samples = {}
+
+    def stage(self, name: str, fn, setup=None):
+        """
+        Run fn `repeat` times (setup() before each run, untimed; its result is passed to fn)
+        and keep the wall times. Returns fn's last result.
+        """
+        result = None
+        for _ in range(self.repeat):
+            arg = setup() if setup else None
+            started = time.perf_counter()
+            result = fn(arg) if setup else fn()
+            self.samples.setdefault(name, []).append(time.perf_counter() - started)
+        return result
+
+    def summary(self) -> dict:
+        return {name: {"median": statistics.median(s), "min": min(s), "runs": len(s)}
+                for name, s in self.samples.items()}
+
+
+def _fresh_dir(path: str) -> str:
+    shutil.rmtree(path, ignore_errors=True)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def bench_task1(timer: Timer, base: str, opts):
+    import feedparser
+    import requests
+
+    import news_scraper
+    from image_assets import IMAGE_CACHE_DIR, fetch_many
+    from script_generator import key_points
+    from stream_encoder import video_frames, write_slides
+    from video_generator import H, W, build_slides
+
+    raw = timer.stage("fetch_feed", lambda: requests.get(news_scraper.FEED_URL, timeout=20).content)
+    news = timer.stage("parse_feed", lambda: [news_scraper.entry_to_news(e, image_url="")
+                                              for e in feedparser.parse(raw).entries[:opts.stories]])
+    links = [n["url"] for n in news]
+    for n, img in zip(news, timer.stage("fetch_og", lambda: news_scraper.extract_og_images(links))):
+        n["image_url"] = img
+    if not news:
+        news = [dict(news_scraper.EMPTY_NEWS)]
+
+    points = timer.stage("script", lambda: key_points(news))
+
+    # cold image cache every run; the render stages below then reuse what this fetched
+    timer.stage("fetch_images",
+                lambda _: fetch_many(urls=[n["image_url"] for n in news],
+                                     queries=[f"{n['source']} news update" for n in news]),
+                setup=lambda: _fresh_dir(IMAGE_CACHE_DIR))
+
+    fps, quality = opts.fps, opts.zoom_quality
+    slides = timer.stage("build_slides", lambda: build_slides(None, news[0], opts.video_seconds, fps, quality,
+                                                              points=points[0]))
+    timer.stage("render", lambda: sum(1 for _ in video_frames(slides, fps, quality)))
+    timer.stage("render_encode",
+                lambda: write_slides(slides, os.path.join("output", "bench.mp4"), (W, H), fps, quality=quality))
+    timer.samples["encode"] = [max(0.0, a - b) for a, b in zip(timer.samples["render_encode"], timer.samples["render"])]
+
+
+def bench_task2(timer: Timer, base: str, opts):
+    import requests
+
+    import crawler
+    import scraper
+    import seo_keywords
+    from blog_generator import generate_blog, to_markdown
+    from keyword_scoring import KeywordScorer
+    from keyword_suggest import SuggestCache, SuggestClient, TokenBucket
+
+    html = timer.stage("fetch_listing", lambda: requests.get(scraper.BASE, timeout=20).content)
+    timer.stage("parse_listing_soup", lambda: scraper.parse_listing(html, scraper.BASE, fast=False))
+    timer.stage("parse_listing", lambda: scraper.parse_listing(html, scraper.BASE))
+
+    products = timer.stage("crawl", lambda: crawler.crawl_all(base_url=to_local(scraper.BASE, base),
+                                                              max_pages=opts.pages))
+    products = sorted(products, key=lambda p: p["url"])[:opts.products]
+    titles = [p["title"] for p in products]
+    seeds = [q for t in titles for q in seo_keywords._seeds(t)]
+
+    # fresh suggest cache per run; the token bucket is opened up so the stage measures our
+    # code and the stand-in, not the production rate limit
+    runs = iter(range(1_000_000))
+
+    def suggest_client():
+        path = os.path.join("output", f"suggest_{next(runs)}.sqlite3")
+        return SuggestClient(seo_keywords.google_suggest, cache=SuggestCache(path),
+                             bucket=TokenBucket(rate=1e9, capacity=10 ** 9))
+
+    found = timer.stage("keyword_fetch", lambda client: client.suggest_many(seeds, limit=5), setup=suggest_client)
+    pools = {t: [s for q in seo_keywords._seeds(t) for s in found[q]] for t in titles}
+    ranked = timer.stage("keyword_scoring", lambda: KeywordScorer(titles).rank_batch(pools))
+    keywords = {t: pool[:4] if len(pool) >= 4 else pool[:3] for t, pool in ranked.items()}
+
+    def blogs():
+        out = []
+        for p in products:
+            title, blog = generate_blog(p, keywords[p["title"]])
+            out.append(to_markdown(title, keywords[p["title"]], blog))
+        return out
+
+    timer.stage("blog", blogs)
+
+
+def bench_task3(timer: Timer, base: str, opts):
+    import emitters
+    from analyzer import analyze_architecture
+    from registry import TemplateRegistry
+
+    requirements = [f"{REQUIREMENTS[i % len(REQUIREMENTS)]} (item {i})" for i in range(opts.requirements)]
+    timer.stage("registry_build", TemplateRegistry)
+    archs = timer.stage("architecture", lambda registry: [analyze_architecture(r, registry) for r in requirements],
+                        setup=TemplateRegistry)
+
+    def clear_emitter_caches():
+        for emit in emitters.EMITTERS.values():
+            emit.cache_clear()
+
+    unique = list(dict.fromkeys(archs))
+    timer.stage("emit", lambda _: [emitters.render(a, fmt) for a in unique for fmt in emitters.EMITTERS],
+                setup=clear_emitter_caches)
+
+
+TASKS = {"task1": bench_task1, "task2": bench_task2, "task3": bench_task3}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time one tool's pipeline stages")
+    parser.add_argument("task", choices=sorted(TASKS))
+    parser.add_argument("--standin", required=True, help="base URL of the running stand-in server")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--out", required=True, help="where to write the timings JSON")
+    parser.add_argument("--stories", type=int, default=5)
+    parser.add_argument("--video-seconds", type=int, default=22)
+    parser.add_argument("--fps", type=int, default=24)
+    parser.add_argument("--zoom-quality", default="high")
+    parser.add_argument("--pages", type=int, default=3)
+    parser.add_argument("--products", type=int, default=40)
+    parser.add_argument("--requirements", type=int, default=2000)
+    opts = parser.parse_args()
+
+    sys.path.insert(0, TASK_DIRS[opts.task])
+    route_requests_through(opts.standin)
+    os.makedirs("output", exist_ok=True)
+
+    timer = Timer(opts.repeat)
+    TASKS[opts.task](timer, opts.standin, opts)
+    with open(opts.out, "w", encoding="utf-8") as f:
+        json.dump(timer.summary(), f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+import hashlib
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+import requests
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# upstream responses are recorded with the same client headers the tools send
+UPSTREAM_HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+
+class FixtureStore:
+    """
+    Recorded HTTP responses: fixtures/index.json maps "GET <url>" to status / content type /
+    body file, bodies live in fixtures/bodies/<sha1>.bin.
+    """
+
+    def __init__(self, root: str = FIXTURES_DIR):
+        self.root = root
+        self.index_path = os.path.join(root, "index.json")
+        self._lock = threading.Lock()
+        self.index = {}
+        if os.path.exists(self.index_path):
+            with open(self.index_path, encoding="utf-8") as f:
+                self.index = json.load(f)
+
+    def get(self, url: str):
+        entry = self.index.get(f"GET {url}")
+        if entry is None:
+            return None
+        with open(os.path.join(self.root, entry["file"]), "rb") as f:
+            return entry["status"], entry["content_type"], f.read()
+
+    def put(self, url: str, status: int, content_type: str, body: bytes):
+        name = os.path.join("bodies", hashlib.sha1(url.encode("utf-8")).hexdigest() + ".bin")
+        with self._lock:
+            os.makedirs(os.path.join(self.root, "bodies"), exist_ok=True)
+            with open(os.path.join(self.root, name), "wb") as f:
+                f.write(body)
+            self.index[f"GET {url}"] = {"status": status, "content_type": content_type, "file": name}
+            with open(self.index_path, "w", encoding="utf-8") as f:
+                json.dump(self.index, f, indent=1, sort_keys=True)
+
+
+def to_upstream(path: str) -> str:
+    """
+    Stand-in path "/https/books.toscrape.com/catalogue/page-1.html?x=1" -> the real URL.
+    """
+    scheme, _, rest = path.lstrip("/").partition("/")
+    return f"{scheme}://{rest}"
+
+
+def to_local(url: str, base: str) -> str:
+    """
+    Real URL -> the same resource on the stand-in server at `base` (inverse of to_upstream).
+    """
+    parts = urlsplit(url)
+    if url.startswith(base) or parts.scheme not in ("http", "https"):
+        return url
+    return f"{base}/{parts.scheme}/{url.split('://', 1)[1]}"
+
+
+class StandIn:
+    """
+    Local HTTP stand-in for every endpoint the tools use. In "replay" mode it only serves
+    fixtures (misses get a 404 and are counted); in "record" mode it fetches misses from the
+    real endpoint once, following redirects, and saves them.
+    """
+
+    def __init__(self, mode: str = "replay", store: FixtureStore = None, port: int = 0):
+        if mode not in ("record", "replay"):
+            raise ValueError(f"mode must be record or replay, got {mode!r}")
+        self.mode = mode
+        self.store = store or FixtureStore()
+        self.misses = []
+        standin = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                status, content_type, body = standin.respond(to_upstream(self.path))
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self.server.daemon_threads = True
+        self.base = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+    def respond(self, url: str) -> tuple:
+        hit = self.store.get(url)
+        if hit is not None:
+            return hit
+        if self.mode == "replay":
+            self.misses.append(url)
+            return 404, "text/plain", b"no fixture recorded for this URL"
+        try:
+            r = requests.get(url, headers=UPSTREAM_HEADERS, timeout=20)
+        except requests.RequestException as e:
+            return 502, "text/plain", str(e).encode("utf-8")
+        content_type = r.headers.get("Content-Type", "application/octet-stream")
+        self.store.put(url, r.status_code, content_type, r.content)
+        return r.status_code, content_type, r.content
+
+    def __enter__(self):
+        threading.Thread(target=self.server.serve_forever, name="standin", daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def route_requests_through(base: str):
+    """
+    Send every `requests` call in this process to the stand-in at `base` (used inside the
+    stage runner, so module-level sessions and hard-coded URLs are covered too).
+    """
+    from requests.adapters import HTTPAdapter
+
+    original = HTTPAdapter.send
+    if getattr(original, "_standin", False):
+        return
+
+    def send(self, request, *args, **kwargs):
+        request.url = to_local(request.url, base)
+        return original(self, request, *args, **kwargs)
+
+    send._standin = True
+    HTTPAdapter.send = send
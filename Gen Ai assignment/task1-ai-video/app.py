@@ -1,26 +1,118 @@
+import argparse
+import sys
+
+import tracing
+from batch import run_batch
+from daemon import DEFAULT_PORT, run_daemon
 from news_scraper import get_trending_news
-from script_generator import generate_script
-from video_generator import create_video
+from renditions import RENDITIONS
+from script_generator import generate_script, key_points
+from video_generator import ENGINES, create_video
+from watch import run_watch
+from worker import cold_import_times, print_timings, run_worker, warm
 
-def run():
+def run(**render_opts):
     print("✅ Starting Task1: AI Video Generator...")
 
-    news = get_trending_news()
+    with tracing.span("news"):
+        news = get_trending_news()
     print("📰 News fetched:", news.get("title"))
 
-    script = generate_script(news)
+    with tracing.span("script"):
+        points = key_points([news])[0]
+        script = generate_script(news, points)
     print("📝 Script generated (first 120 chars):", script[:120])
 
-    out_path = create_video(script_text=script, news=news, total_duration_sec=45, fps=24)
+    with tracing.span("video"):
+        out_path = create_video(script_text=script, news=news, points=points, **render_opts)
 
 
 
 
     print("🎬 Video created at:", out_path)
 
+def run_batch_mode(limit=None, workers=None, **render_opts):
+    print("✅ Starting Task1: AI Video Generator (batch)...")
+    manifest_path = run_batch(limit=limit, workers=workers, **render_opts)
+    print("📦 Manifest written to:", manifest_path)
+
+def run_watch_mode(interval=300, limit=None, workers=None, **render_opts):
+    print(f"✅ Starting Task1: AI Video Generator (watching feed every {interval}s)...")
+    run_watch(interval=interval, limit=limit, workers=workers, **render_opts)
+
+def run_worker_mode(infile=None, **render_opts):
+    print("✅ Starting Task1: AI Video Generator (warm worker, jobs as JSON lines on stdin)...", file=sys.stderr)
+    stats = run_worker(infile=infile, **render_opts)
+    print(f"📦 Worker done: {stats['ok']}/{stats['jobs']} jobs ok", file=sys.stderr)
+
+def run_daemon_mode(host="127.0.0.1", port=DEFAULT_PORT, workers=None, **render_opts):
+    print("✅ Starting Task1: AI Video Generator (render daemon)...")
+    run_daemon(host=host, port=port, workers=workers, **render_opts)
+
+def run_import_report(engine="stream"):
+    print_timings("Cold imports (fresh interpreter)", cold_import_times())
+    print_timings("Warm-up (paid once per worker)", warm(engine))
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description="AI news video generator")
+    parser.add_argument("--batch", action="store_true", help="render a video for every feed entry")
+    parser.add_argument("--watch", action="store_true", help="poll the feed and render only new or changed stories")
+    parser.add_argument("--interval", type=int, default=300, help="seconds between polls (watch mode)")
+    parser.add_argument("--limit", type=int, default=None, help="only the top N feed entries (batch/watch mode)")
+    parser.add_argument("--workers", type=int, default=None, help="render processes (default: CPU count)")
+    parser.add_argument("--preview", action="store_true", help="fast preview-quality zoom rendering")
+    parser.add_argument("--engine", choices=ENGINES, default="stream",
+                        help="stream: pipe frames into ffmpeg, segments: parallel per-slide encode + concat, "
+                             "moviepy: original clip pipeline")
+    parser.add_argument("--renditions", default="",
+                        help=f"extra outputs from the same render pass, comma-separated: {','.join(RENDITIONS)}")
+    parser.add_argument("--worker", nargs="?", const="", default=None, metavar="JOBS",
+                        help="stay warm and render JSON-line jobs from JOBS (default: stdin), one result line each")
+    parser.add_argument("--daemon", action="store_true",
+                        help="serve a local HTTP render API (POST /jobs, GET /jobs/<id>, GET /status)")
+    parser.add_argument("--host", default="127.0.0.1", help="daemon bind address")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help="daemon port")
+    parser.add_argument("--import-times", action="store_true",
+                        help="report cold import and warm-up costs, then exit")
+    parser.add_argument("--trace", action="store_true",
+                        help=f"record per-stage timings/resources to a JSON + Prometheus report in {tracing.TRACE_DIR}")
+    return parser.parse_args()
+
 if __name__ == "__main__":
+    args = _parse_args()
+    render_opts = {
+        "total_duration_sec": 45,
+        "fps": 24,
+        "zoom_quality": "preview" if args.preview else "high",
+        "engine": args.engine,
+        "renditions": [r.strip() for r in args.renditions.split(",") if r.strip()],
+    }
+    if args.trace:
+        tracing.enable()
+    exit_code = 0
     try:
-        run()
+        if args.import_times:
+            run_import_report(args.engine)
+        elif args.daemon:
+            run_daemon_mode(host=args.host, port=args.port, workers=args.workers, **render_opts)
+        elif args.worker is not None:
+            run_worker_mode(infile=args.worker or None, **render_opts)
+        elif args.watch:
+            run_watch_mode(interval=args.interval, limit=args.limit, workers=args.workers, **render_opts)
+        elif args.batch:
+            run_batch_mode(limit=args.limit, workers=args.workers, **render_opts)
+        else:
+            run(**render_opts)
     except Exception as e:
         print("❌ ERROR:", e)
-        input("Press Enter to close...")
+        # only hold the window open for someone actually looking at it; unattended runs just fail
+        if sys.stdin.isatty():
+            input("Press Enter to close...")
+        exit_code = 1
+    finally:
+        if args.trace and not args.watch:
+            json_path, prom_path = tracing.write_report()
+            # worker mode keeps stdout for its JSON result lines
+            log = sys.stderr if args.worker is not None else sys.stdout
+            print("📈 Trace written to:", json_path, "and", prom_path, file=log)
+    sys.exit(exit_code)
@@ -0,0 +1,113 @@
+import json
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import tracing
+from news_scraper import FEED_URL, get_trending_news_list
+from renditions import rendition_path
+from script_generator import key_points
+from video_generator import create_video
+
+BATCH_DIR = os.path.join("output", "batch")
+
+
+def _slugify(text: str, max_len: int = 48) -> str:
+    slug = re.sub(r"[^a-z0-9]+", "-", (text or "").lower()).strip("-")
+    return slug[:max_len].rstrip("-") or "story"
+
+
+def _render_one(index: int, news: dict, points: list[str], out_path: str, threads: int, render_opts: dict,
+                trace: bool = False) -> dict:
+    """
+    Worker entry point: one story (and its key points) -> one MP4. Runs in a child process.
+    render_opts are passed through to create_video (total_duration_sec, fps, engine, ...).
+    With trace, the worker's tracing report comes back in entry["trace"] for the parent to merge.
+    """
+    if trace:
+        tracing.enable()
+    started = time.time()
+    entry = {
+        "index": index,
+        "title": news.get("title", ""),
+        "source": news.get("source", ""),
+        "url": news.get("url", ""),
+        "output": out_path,
+    }
+    renditions = render_opts.get("renditions")
+    if renditions:
+        entry["renditions"] = {name: rendition_path(out_path, name) for name in renditions}
+    try:
+        with tracing.span("story"):
+            create_video(news=news, points=points, out_path=out_path, threads=threads, **render_opts)
+        entry["status"] = "ok"
+    except Exception as e:
+        entry["status"] = "error"
+        entry["error"] = str(e)
+    entry["seconds"] = round(time.time() - started, 2)
+    if trace:
+        entry["trace"] = tracing.report()
+    return entry
+
+
+def render_stories(stories: list[dict], out_dir: str, workers: int = None, **render_opts) -> list[dict]:
+    """
+    Render news dicts in a process pool into out_dir. Returns one manifest entry per story, in order.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+
+    cores = os.cpu_count() or 1
+    workers = max(1, min(workers or cores, len(stories) or 1))
+    # x264 is multi-threaded too: split the cores between workers instead of oversubscribing
+    threads = max(1, cores // workers)
+
+    # one summarizer pass over the whole feed instead of one per story
+    with tracing.span("script", stories=len(stories)):
+        points = key_points(stories)
+
+    entries = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = []
+        for i, (news, story_points) in enumerate(zip(stories, points), start=1):
+            out_path = os.path.join(out_dir, f"{i:03d}_{_slugify(news.get('title'))}.mp4")
+            futures.append(pool.submit(_render_one, i, news, story_points, out_path, threads, render_opts,
+                                       tracing.enabled()))
+
+        for fut in as_completed(futures):
+            entry = fut.result()
+            trace = entry.pop("trace", None)
+            if trace:
+                tracing.merge(trace, story=entry["index"])
+            entries.append(entry)
+            mark = "✅" if entry["status"] == "ok" else "❌"
+            print(f"{mark} [{entry['index']}/{len(stories)}] {entry['title'][:60]} ({entry['seconds']}s)")
+
+    entries.sort(key=lambda e: e["index"])
+    return entries
+
+
+def write_manifest(entries: list[dict], out_dir: str, workers: int = None) -> str:
+    manifest = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "workers": workers,
+        "count": len(entries),
+        "ok": sum(1 for e in entries if e["status"] == "ok"),
+        "videos": entries,
+    }
+    manifest_path = os.path.join(out_dir, "manifest.json")
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+    return manifest_path
+
+
+def run_batch(limit: int = None, workers: int = None, out_dir: str = BATCH_DIR, feed_url: str = FEED_URL,
+              **render_opts) -> str:
+    """
+    Render a video for every feed entry (or the top `limit`) in a process pool.
+    Writes `<index>_<slug>.mp4` per story plus `manifest.json`; returns the manifest path.
+    render_opts are create_video options (total_duration_sec, fps, zoom_quality, engine, renditions).
+    """
+    stories = get_trending_news_list(limit=limit, feed_url=feed_url)
+    entries = render_stories(stories, out_dir, workers=workers, **render_opts)
+    return write_manifest(entries, out_dir, workers=workers or os.cpu_count())
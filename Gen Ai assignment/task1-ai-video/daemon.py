@@ -0,0 +1,286 @@
+"""
+Render daemon: a local HTTP API in front of a bounded pool of warm render processes.
+
+    POST /jobs  {"news": {...}, "priority": 5}                 -> 202 {"job": {...}, "merged": false}
+    POST /jobs  {"feed_url": "https://...", "limit": 3}        -> 202 {"jobs": [...]} (one job per entry)
+    GET  /jobs/<id>                                            -> status, output path, error, timings
+    GET  /jobs  |  GET /status                                 -> all jobs  |  queue/pool counters
+
+Higher priority runs first (FIFO within a priority). A job identical to one still queued or
+running (same news, script and options) is merged into it instead of rendering twice.
+"""
+import hashlib
+import heapq
+import itertools
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from news_scraper import FEED_URL, get_trending_news_list
+from worker import run_job, warm
+
+DAEMON_DIR = os.path.join("output", "daemon")
+DEFAULT_PORT = 8787
+MAX_FINISHED_JOBS = 1000
+
+# create_video options a client may set per job (out_path / threads stay under daemon control)
+JOB_OPTIONS = ("total_duration_sec", "fps", "zoom_quality", "engine", "renditions")
+
+
+def job_hash(news: dict, script: str = None, options: dict = None) -> str:
+    payload = {"news": news, "script": script or "", "options": options or {}}
+    return hashlib.sha1(json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+class RenderDaemon:
+    """
+    Priority queue + in-flight dedup in this process; renders run in a ProcessPoolExecutor whose
+    workers are warmed once (worker.warm) and then reused for every job.
+    """
+
+    def __init__(self, workers: int = None, out_dir: str = DAEMON_DIR, **render_opts):
+        cores = os.cpu_count() or 1
+        self.workers = max(1, workers or cores)
+        self.out_dir = out_dir
+        # x264 is multi-threaded too: split the cores between workers instead of oversubscribing
+        self.render_opts = dict(render_opts, threads=max(1, cores // self.workers))
+        self.jobs = OrderedDict()  # id -> public job record
+        self._payloads = {}        # id -> {"news", "script", "options"} until the job finishes
+        self._inflight = {}        # content hash -> id of the queued/running job
+        self._queue = []           # heap of (-priority, seq, id)
+        self._running = 0
+        self._closed = False
+        self._seq = itertools.count(1)  # heap tie-breaker (FIFO within a priority)
+        self._ids = itertools.count(1)
+        self._cond = threading.Condition()
+        self._engine = render_opts.get("engine", "stream")
+        self._pool = self._new_pool()
+        self._dispatcher = threading.Thread(target=self._dispatch, name="dispatch", daemon=True)
+        self._dispatcher.start()
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.workers, initializer=warm, initargs=(self._engine,))
+
+    def submit(self, news: dict, script: str = None, options: dict = None, priority: int = 0) -> tuple:
+        """
+        Queue one render; returns (job record, merged). A merged duplicate keeps the existing
+        job but raises its priority if the new request is more urgent and it has not started yet.
+        """
+        unknown = set(options or {}) - set(JOB_OPTIONS)
+        if unknown:
+            raise ValueError(f"unsupported options: {', '.join(sorted(unknown))}")
+        digest = job_hash(news, script, options)
+        with self._cond:
+            existing = self._inflight.get(digest)
+            if existing:
+                job = self.jobs[existing]
+                job["merged"] += 1
+                if job["status"] == "queued" and priority > job["priority"]:
+                    job["priority"] = priority
+                    heapq.heappush(self._queue, (-priority, next(self._seq), existing))
+                    self._cond.notify_all()
+                return dict(job), True
+
+            seq = next(self._seq)
+            job_id = f"j{next(self._ids):06d}"
+            job = {
+                "id": job_id,
+                "hash": digest,
+                "title": (news or {}).get("title", ""),
+                "priority": priority,
+                "status": "queued",
+                "merged": 0,
+                "submitted_at": time.time(),
+            }
+            self.jobs[job_id] = job
+            self._payloads[job_id] = {"news": news, "script": script, "options": options or {}}
+            self._inflight[digest] = job_id
+            heapq.heappush(self._queue, (-priority, seq, job_id))
+            self._cond.notify_all()
+            return dict(job), False
+
+    def submit_feed(self, feed_url: str = FEED_URL, limit: int = None, options: dict = None,
+                    priority: int = 0) -> list[dict]:
+        """
+        One job per feed entry (or the top `limit`), each deduplicated like submit().
+        """
+        stories = get_trending_news_list(limit=limit, feed_url=feed_url)
+        return [dict(job, deduplicated=merged)
+                for job, merged in (self.submit(news, options=options, priority=priority) for news in stories)]
+
+    def get(self, job_id: str):
+        with self._cond:
+            job = self.jobs.get(job_id)
+            return dict(job) if job else None
+
+    def list_jobs(self) -> list[dict]:
+        with self._cond:
+            return [dict(job) for job in self.jobs.values()]
+
+    def status(self) -> dict:
+        with self._cond:
+            counts = {}
+            for job in self.jobs.values():
+                counts[job["status"]] = counts.get(job["status"], 0) + 1
+            return {"workers": self.workers, "running": self._running,
+                    "queued": counts.get("queued", 0), "jobs": counts}
+
+    def _dispatch(self):
+        while True:
+            with self._cond:
+                while not self._closed and (self._running >= self.workers or not self._queue):
+                    self._cond.wait()
+                if self._closed:
+                    return
+                neg_priority, _, job_id = heapq.heappop(self._queue)
+                job = self.jobs.get(job_id)
+                # stale heap entry: the job was re-prioritised (pushed again) or already started
+                if job is None or job["status"] != "queued" or job["priority"] != -neg_priority:
+                    continue
+                job["status"] = "running"
+                job["started_at"] = time.time()
+                self._running += 1
+                payload = dict(self._payloads[job_id], id=job_id)
+            pool = self._pool
+            try:
+                future = pool.submit(run_job, payload, self.out_dir, **self.render_opts)
+            except BrokenProcessPool:
+                # the pool broke before _finish saw the crash: this job never ran, so give it a
+                # fresh pool instead of failing it
+                pool = self._replace_pool(pool)
+                try:
+                    future = pool.submit(run_job, payload, self.out_dir, **self.render_opts)
+                except (BrokenProcessPool, RuntimeError) as e:
+                    self._complete(job_id, {"status": "error", "error": f"{type(e).__name__}: {e}"})
+                    continue
+            except RuntimeError as e:  # shut down by close()
+                self._complete(job_id, {"status": "error", "error": f"{type(e).__name__}: {e}"})
+                continue
+            future.add_done_callback(lambda f, job_id=job_id, pool=pool: self._finish(job_id, f, pool))
+
+    def _replace_pool(self, broken: ProcessPoolExecutor) -> ProcessPoolExecutor:
+        """
+        Swap a broken pool for a fresh warm one (once, however many futures report the break).
+        """
+        with self._cond:
+            if self._pool is broken and not self._closed:
+                broken.shutdown(wait=False, cancel_futures=True)
+                self._pool = self._new_pool()
+            return self._pool
+
+    def _finish(self, job_id: str, future, pool: ProcessPoolExecutor):
+        try:
+            result = future.result()
+        except Exception as e:  # the worker process died (BrokenProcessPool, pickling, ...)
+            result = {"status": "error", "error": f"{type(e).__name__}: {e}"}
+            if isinstance(e, BrokenProcessPool):
+                # a render process died (OOM kill, segfault) and took the pool with it: replace
+                # it now so the next queued job does not land on the dead pool
+                self._replace_pool(pool)
+        self._complete(job_id, result)
+
+    def _complete(self, job_id: str, result: dict):
+        with self._cond:
+            job = self.jobs[job_id]
+            job.update(status=result["status"], finished_at=time.time(), seconds=result.get("seconds"))
+            for key in ("output", "error"):
+                if key in result:
+                    job[key] = result[key]
+            self._running -= 1
+            self._payloads.pop(job_id, None)
+            self._inflight.pop(job["hash"], None)
+            self._evict_finished()
+            self._cond.notify_all()
+        mark = "✅" if result["status"] == "ok" else "❌"
+        detail = f"{job['seconds']}s" if job.get("seconds") is not None else job.get("error", "")
+        print(f"{mark} {job_id} {job['title'][:60]} ({detail})")
+
+    def _evict_finished(self):
+        finished = [i for i, job in self.jobs.items() if job["status"] in ("ok", "error")]
+        for job_id in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self.jobs[job_id]
+
+    def close(self, wait: bool = True):
+        """
+        Stop dispatching; queued jobs are dropped, running renders finish when wait is set.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._pool.shutdown(wait=wait, cancel_futures=True)
+
+
+def make_server(daemon: RenderDaemon, host: str = "127.0.0.1", port: int = DEFAULT_PORT) -> ThreadingHTTPServer:
+    class Handler(BaseHTTPRequestHandler):
+        def _send(self, status: int, body: dict):
+            data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            path = self.path.split("?", 1)[0].rstrip("/")
+            if path == "/status":
+                self._send(200, daemon.status())
+            elif path == "/jobs":
+                self._send(200, {"jobs": daemon.list_jobs()})
+            elif path.startswith("/jobs/"):
+                job = daemon.get(path[len("/jobs/"):])
+                if job:
+                    self._send(200, job)
+                else:
+                    self._send(404, {"error": "unknown job"})
+            else:
+                self._send(404, {"error": "not found"})
+
+        def do_POST(self):
+            if self.path.split("?", 1)[0].rstrip("/") != "/jobs":
+                return self._send(404, {"error": "not found"})
+            try:
+                length = int(self.headers.get("Content-Length") or 0)
+                body = json.loads(self.rfile.read(length) or b"{}")
+                if not isinstance(body, dict):
+                    raise ValueError("request body must be a JSON object")
+                priority = int(body.get("priority", 0))
+                options = body.get("options") or {}
+                if body.get("news"):
+                    if not isinstance(body["news"], dict):
+                        raise ValueError('"news" must be an object')
+                    job, merged = daemon.submit(body["news"], script=body.get("script"), options=options,
+                                                priority=priority)
+                    return self._send(200 if merged else 202, {"job": job, "merged": merged})
+                if body.get("feed_url"):
+                    jobs = daemon.submit_feed(body["feed_url"], limit=body.get("limit"), options=options,
+                                              priority=priority)
+                    return self._send(202, {"jobs": jobs})
+                raise ValueError('request needs "news" or "feed_url"')
+            except (ValueError, TypeError) as e:
+                self._send(400, {"error": str(e)})
+
+        def log_message(self, *args):
+            pass
+
+    return ThreadingHTTPServer((host, port), Handler)
+
+
+def run_daemon(host: str = "127.0.0.1", port: int = DEFAULT_PORT, workers: int = None, **render_opts):
+    """
+    Serve the render API until interrupted; running renders are allowed to finish on shutdown.
+    """
+    daemon = RenderDaemon(workers=workers, **render_opts)
+    server = make_server(daemon, host, port)
+    print(f"🛰️ Render daemon listening on http://{host}:{server.server_address[1]} ({daemon.workers} workers)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        daemon.close()
@@ -0,0 +1,66 @@
+import os
+import sqlite3
+import time
+
+FEED_DB_PATH = os.path.join("output", "feed_state.sqlite3")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS feeds (
+    feed_url      TEXT PRIMARY KEY,
+    etag          TEXT,
+    modified      TEXT,
+    checked_at    REAL
+);
+CREATE TABLE IF NOT EXISTS stories (
+    entry_id      TEXT PRIMARY KEY,
+    content_hash  TEXT NOT NULL,
+    title         TEXT,
+    output        TEXT,
+    processed_at  REAL
+);
+"""
+
+
+class FeedStore:
+    """
+    Small persistent index for watch mode: HTTP validators per feed (ETag / Last-Modified)
+    and the content hash of every story that has already been rendered.
+    """
+
+    def __init__(self, path: str = FEED_DB_PATH):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+
+    def close(self):
+        self.conn.close()
+
+    def get_validators(self, feed_url: str) -> tuple:
+        row = self.conn.execute("SELECT etag, modified FROM feeds WHERE feed_url = ?", (feed_url,)).fetchone()
+        return row if row else (None, None)
+
+    def set_validators(self, feed_url: str, etag: str = None, modified: str = None):
+        """
+        Save the feed's validators. A None keeps the stored value: a failed fetch has none, and
+        dropping them would turn the next poll into a full download.
+        """
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO feeds (feed_url, etag, modified, checked_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(feed_url) DO UPDATE SET etag = COALESCE(excluded.etag, feeds.etag), "
+                "modified = COALESCE(excluded.modified, feeds.modified), checked_at = excluded.checked_at",
+                (feed_url, etag, modified, time.time()),
+            )
+
+    def is_new_or_changed(self, entry_id: str, content_hash: str) -> bool:
+        row = self.conn.execute("SELECT content_hash FROM stories WHERE entry_id = ?", (entry_id,)).fetchone()
+        return row is None or row[0] != content_hash
+
+    def mark_processed(self, entry_id: str, content_hash: str, title: str = "", output: str = ""):
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO stories (entry_id, content_hash, title, output, processed_at) VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(entry_id) DO UPDATE SET content_hash = excluded.content_hash, "
+                "title = excluded.title, output = excluded.output, processed_at = excluded.processed_at",
+                (entry_id, content_hash, title, output, time.time()),
+            )
@@ -0,0 +1,166 @@
+import hashlib
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
+
+from PIL import Image
+
+import tracing
+
+SIZE = (1280, 720)
+HEADERS = {"User-Agent": "Mozilla/5.0"}
+TIMEOUT = 12
+
+IMAGE_CACHE_DIR = os.path.join("output", "cache", "images")
+IMAGE_CACHE_MAX_ENTRIES = 500
+
+# Pillow resampling compatibility (works across versions)
+try:
+    RESAMPLE = Image.Resampling.LANCZOS
+except AttributeError:
+    RESAMPLE = Image.LANCZOS
+
+_session = None
+_session_pid = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """
+    One pooled, keep-alive requests.Session per process (a forked batch worker gets its own).
+    requests is imported here, on first use, so script-only runs never load it.
+    """
+    global _session, _session_pid
+    with _session_lock:
+        if _session is None or _session_pid != os.getpid():
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            s = requests.Session()
+            s.headers.update(HEADERS)
+            adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+            s.mount("http://", adapter)
+            s.mount("https://", adapter)
+            _session, _session_pid = s, os.getpid()
+        return _session
+
+
+class DiskImageCache:
+    """
+    Content-addressed LRU cache of already-resized images on disk.
+
+    Entries are JPEG files named by the SHA-1 of their key; a hit refreshes the
+    file's mtime, and the oldest files are evicted once max_entries is exceeded.
+    Writes go through a temp file + os.replace, so concurrent batch workers are safe.
+    """
+
+    def __init__(self, cache_dir: str = IMAGE_CACHE_DIR, max_entries: int = IMAGE_CACHE_MAX_ENTRIES):
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.jpg")
+
+    def get(self, key: str):
+        path = self._path(key)
+        try:
+            with Image.open(path) as img:
+                img = img.convert("RGB")
+            os.utime(path)
+        except (OSError, ValueError):
+            tracing.count("cache_misses", cache="images")
+            return None
+        tracing.count("cache_hits", cache="images")
+        return img
+
+    def put(self, key: str, img: Image.Image):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.part"
+        img.save(tmp_path, format="JPEG", quality=90)
+        os.replace(tmp_path, path)
+        self._evict()
+
+    def _evict(self):
+        entries = []
+        for name in os.listdir(self.cache_dir):
+            if not name.endswith(".jpg"):
+                continue
+            try:
+                entries.append((os.stat(os.path.join(self.cache_dir, name)).st_mtime, name))
+            except FileNotFoundError:
+                pass
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort()
+        for _, name in entries[:len(entries) - self.max_entries]:
+            try:
+                os.remove(os.path.join(self.cache_dir, name))
+            except FileNotFoundError:
+                pass
+
+
+_cache = DiskImageCache()
+
+
+def unsplash_url(query: str, size: tuple = SIZE) -> str:
+    """
+    Free source endpoint (no API key): https://source.unsplash.com/1280x720/?<query>
+    Query improves relevance but Unsplash source is still random-ish.
+    """
+    q = re.sub(r"[^a-zA-Z0-9\s-]", "", query or "").strip().replace(" ", ",")
+    return f"https://source.unsplash.com/{size[0]}x{size[1]}/?{q if q else 'news'}"
+
+
+def fetch_image(url: str, size: tuple = SIZE, cache: DiskImageCache = None):
+    """
+    Image at url resized to `size`, from the disk cache when possible. None on failure.
+    """
+    cache = cache or _cache
+    key = f"{size[0]}x{size[1]}|{url}"
+    img = cache.get(key)
+    if img is not None:
+        return img
+    try:
+        r = get_session().get(url, timeout=TIMEOUT)
+        r.raise_for_status()
+        tracing.count("bytes_downloaded", len(r.content), kind="image")
+        img = Image.open(BytesIO(r.content)).convert("RGB").resize(size, RESAMPLE)
+    except Exception as e:
+        tracing.record_exception("image_fetch", e)
+        return None
+    cache.put(key, img)
+    return img
+
+
+def fetch_bg_image(query: str, size: tuple = SIZE, cache: DiskImageCache = None) -> Image.Image:
+    """
+    Keyword background for a query; a near-black frame when the fetch fails (not cached).
+    Caching by query also means a repeated query (e.g. the outro) gets the same picture every run.
+    """
+    img = fetch_image(unsplash_url(query, size), size, cache)
+    if img is None:
+        tracing.count("fallback_backgrounds")
+        return Image.new("RGB", size, (12, 12, 12))
+    return img
+
+
+def fetch_many(urls: list[str] = (), queries: list[str] = (), size: tuple = SIZE, workers: int = 8) -> dict:
+    """
+    Fetch article images and keyword backgrounds concurrently.
+    Returns {("url", url): Image | None, ("query", query): Image}.
+    """
+    jobs = [("url", u) for u in dict.fromkeys(urls) if u]
+    jobs += [("query", q) for q in dict.fromkeys(queries)]
+    if not jobs:
+        return {}
+
+    def run(job):
+        kind, value = job
+        return fetch_image(value, size) if kind == "url" else fetch_bg_image(value, size)
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        return dict(zip(jobs, pool.map(run, jobs)))
@@ -1,8 +1,12 @@
+import codecs
+import hashlib
 import re
+from concurrent.futures import ThreadPoolExecutor
 from html import unescape
-import requests
-import feedparser
-from bs4 import BeautifulSoup
+from html.parser import HTMLParser
+
+import tracing
+from image_assets import get_session
 
 def _clean_text(text: str) -> str:
     if not text:
@@ -18,36 +22,78 @@ def _extract_source_from_title(title: str) -> str:
         return title.split(" - ")[-1].strip()
     return "News"
 
+OG_IMAGE_BYTE_CAP = 256 * 1024  # <head> is almost always well inside this
+OG_IMAGE_CHUNK = 16 * 1024
+
+class _OgImageParser(HTMLParser):
+    """
+    Incremental parser that only cares about <meta property="og:image"> inside <head>.
+    """
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.image = ""
+        self.done = False
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "body":
+            self.done = True
+        elif tag == "meta" and not self.image:
+            a = dict(attrs)
+            if (a.get("property") or a.get("name") or "").lower() in ("og:image", "og:image:url") and a.get("content"):
+                self.image = a["content"].strip()
+                self.done = True
+
+    def handle_endtag(self, tag):
+        if tag == "head":
+            self.done = True
+
 def _extract_og_image(article_url: str) -> str:
+    """
+    Stream the article and parse only up to </head> (or OG_IMAGE_BYTE_CAP bytes) for og:image.
+    """
     try:
-        r = requests.get(article_url, timeout=12, headers={"User-Agent": "Mozilla/5.0"})
-        r.raise_for_status()
-        soup = BeautifulSoup(r.text, "lxml")
-        tag = soup.find("meta", property="og:image")
-        if tag and tag.get("content"):
-            return tag["content"].strip()
-    except:
-        pass
+        with get_session().get(article_url, timeout=12, stream=True) as r:
+            r.raise_for_status()
+            decoder = codecs.getincrementaldecoder(r.encoding or "utf-8")(errors="replace")
+            parser = _OgImageParser()
+            read = 0
+            for chunk in r.iter_content(chunk_size=OG_IMAGE_CHUNK):
+                parser.feed(decoder.decode(chunk))
+                read += len(chunk)
+                if parser.done or read >= OG_IMAGE_BYTE_CAP:
+                    break
+            tracing.count("bytes_downloaded", read, kind="article_head")
+            return parser.image
+    except Exception as e:
+        tracing.record_exception("og_image", e)
     return ""
 
-def get_trending_news():
-    feed_url = "https://news.google.com/rss?hl=en-IN&gl=IN&ceid=IN:en"
-    feed = feedparser.parse(feed_url)
+def extract_og_images(article_urls: list[str], workers: int = 8) -> list[str]:
+    """
+    og:image for many articles concurrently ("" where missing), in input order.
+    """
+    todo = [u for u in dict.fromkeys(article_urls) if u]
+    if not todo:
+        return ["" for _ in article_urls]
+    with ThreadPoolExecutor(max_workers=min(workers, len(todo))) as pool:
+        found = dict(zip(todo, pool.map(_extract_og_image, todo)))
+    return [found.get(u, "") for u in article_urls]
 
-    if not feed.entries:
-        return {"title": "No trending news found", "description": "Please try again later.", "url": "", "image_url": "", "source": "News"}
+FEED_URL = "https://news.google.com/rss?hl=en-IN&gl=IN&ceid=IN:en"
 
-    first = feed.entries[0]
+EMPTY_NEWS = {"title": "No trending news found", "description": "Please try again later.", "url": "", "image_url": "", "source": "News"}
 
-    raw_title = _clean_text(first.get("title", "Trending News"))
+def entry_to_news(entry, image_url: str = None) -> dict:
+    raw_title = _clean_text(entry.get("title", "Trending News"))
     source = _extract_source_from_title(raw_title)
 
     # Remove " - Publisher" from headline for cleaner display
     title = raw_title.split(" - ")[0].strip() if " - " in raw_title else raw_title
 
-    desc = _clean_text(first.get("summary", ""))
-    url = first.get("link", "")
-    image_url = _extract_og_image(url) if url else ""
+    desc = _clean_text(entry.get("summary", ""))
+    url = entry.get("link", "")
+    if image_url is None:
+        image_url = _extract_og_image(url) if url else ""
 
     return {
         "title": title,
@@ -56,3 +102,60 @@ def get_trending_news():
         "image_url": image_url,
         "source": source
     }
+
+def get_trending_news_list(limit: int = None, feed_url: str = FEED_URL) -> list[dict]:
+    """
+    All feed entries (or the top `limit`) as news dicts, in feed order.
+    """
+    import feedparser
+
+    with tracing.span("feed"):
+        feed = feedparser.parse(feed_url)
+    entries = feed.entries[:limit] if limit else feed.entries
+    with tracing.span("og_images", articles=len(entries)):
+        images = extract_og_images([e.get("link", "") for e in entries])
+    return [entry_to_news(e, image_url=img) for e, img in zip(entries, images)]
+
+def entry_key(entry) -> str:
+    return entry.get("id") or entry.get("link") or _clean_text(entry.get("title", ""))
+
+def entry_hash(entry) -> str:
+    """
+    Hash of what ends up in the video, so an edited headline or summary counts as changed.
+    """
+    parts = [_clean_text(entry.get("title", "")), _clean_text(entry.get("summary", "")), entry.get("link", "")]
+    return hashlib.sha1("\x1f".join(parts).encode("utf-8")).hexdigest()
+
+def poll_feed(store, feed_url: str = FEED_URL, limit: int = None) -> tuple:
+    """
+    Conditional GET of the feed (ETag / Last-Modified kept in `store`, a FeedStore).
+    Returns (fresh, validators): only new or changed entries as {"id", "hash", "news"} ([] on
+    304 Not Modified) and the feed's (etag, modified). The validators are not saved here: the
+    caller stores them once every fresh entry is processed, so a failed story is seen again.
+    """
+    import feedparser
+
+    etag, modified = store.get_validators(feed_url)
+    with tracing.span("feed"):
+        feed = feedparser.parse(feed_url, etag=etag, modified=modified)
+    if feed.get("status") == 304:
+        return [], (etag, modified)
+    validators = (feed.get("etag"), feed.get("modified"))
+
+    entries = feed.entries[:limit] if limit else feed.entries
+    fresh = []
+    for e in entries:
+        key, digest = entry_key(e), entry_hash(e)
+        if store.is_new_or_changed(key, digest):
+            fresh.append((e, key, digest))
+
+    with tracing.span("og_images", articles=len(fresh)):
+        images = extract_og_images([e.get("link", "") for e, _, _ in fresh])
+    return [{"id": key, "hash": digest, "news": entry_to_news(e, image_url=img)}
+            for (e, key, digest), img in zip(fresh, images)], validators
+
+def get_trending_news():
+    items = get_trending_news_list(limit=1)
+    if not items:
+        return dict(EMPTY_NEWS)
+    return items[0]
@@ -0,0 +1,160 @@
+import os
+from functools import lru_cache
+
+from PIL import Image, ImageDraw, ImageFont
+
+import tracing
+
+W, H = 1280, 720
+
+FONT_CANDIDATES = {
+    True: [
+        r"C:\Windows\Fonts\arialbd.ttf",
+        r"C:\Windows\Fonts\calibri.ttf",
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf",
+    ],
+    False: [
+        r"C:\Windows\Fonts\arial.ttf",
+        r"C:\Windows\Fonts\calibri.ttf",
+        "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf",
+    ],
+}
+
+# Anchor + speech bubble placement on the slide (right side of the panel)
+CHAR_X, CHAR_Y, CHAR_SCALE = W - 280, 230, 1.05
+BUBBLE_BOX = (W - 520, 210, W - 290, 310)
+
+
+@lru_cache(maxsize=None)
+def _font_path(bold: bool = False):
+    """
+    First usable font file for the weight; the filesystem is probed once per process.
+    """
+    for p in FONT_CANDIDATES[bool(bold)]:
+        if os.path.exists(p):
+            try:
+                ImageFont.truetype(p, 12)
+                return p
+            except OSError as e:
+                tracing.record_exception("font", e)
+    tracing.count("font_fallbacks", bold=bool(bold))
+    return None
+
+
+@lru_cache(maxsize=64)
+def get_font(size=46, bold=False):
+    """
+    Memoized font: the same (size, bold) always returns the same FreeTypeFont object.
+    """
+    path = _font_path(bold)
+    if path:
+        return ImageFont.truetype(path, size)
+    return ImageFont.load_default()
+
+
+def _draw_cute_anchor(draw: ImageDraw.ImageDraw, x: int, y: int, scale: float = 1.0):
+    """
+    Draw a simple cute cartoon character (news anchor) with a speech bubble vibe.
+    No external assets required.
+    """
+    # Colors
+    skin = (255, 220, 190)
+    hair = (35, 35, 35)
+    suit = (35, 90, 160)
+    shirt = (245, 245, 245)
+    tie = (220, 70, 70)
+    outline = (20, 20, 20)
+
+    # Sizes
+    head_r = int(52 * scale)
+    body_w = int(140 * scale)
+    body_h = int(170 * scale)
+
+    # Head
+    cx, cy = x + head_r, y + head_r
+    draw.ellipse((x, y, x + 2 * head_r, y + 2 * head_r), fill=skin, outline=outline, width=3)
+
+    # Hair
+    draw.pieslice((x - 6, y - 10, x + 2 * head_r + 6, y + 2 * head_r + 10),
+                  start=200, end=360, fill=hair, outline=None)
+
+    # Eyes
+    eye_y = y + int(55 * scale)
+    draw.ellipse((x + int(35 * scale), eye_y, x + int(48 * scale), eye_y + int(13 * scale)), fill=outline)
+    draw.ellipse((x + int(70 * scale), eye_y, x + int(83 * scale), eye_y + int(13 * scale)), fill=outline)
+
+    # Smile
+    smile_y = y + int(85 * scale)
+    draw.arc((x + int(38 * scale), smile_y, x + int(92 * scale), smile_y + int(40 * scale)),
+             start=10, end=170, fill=outline, width=3)
+
+    # Body (suit)
+    body_x1 = x - int(18 * scale)
+    body_y1 = y + 2 * head_r - int(5 * scale)
+    body_x2 = body_x1 + body_w
+    body_y2 = body_y1 + body_h
+    draw.rounded_rectangle((body_x1, body_y1, body_x2, body_y2), radius=int(22 * scale),
+                           fill=suit, outline=outline, width=3)
+
+    # Shirt triangle
+    draw.polygon([
+        (x + int(25 * scale), body_y1 + int(10 * scale)),
+        (x + int(55 * scale), body_y1 + int(10 * scale)),
+        (x + int(40 * scale), body_y1 + int(70 * scale)),
+    ], fill=shirt)
+
+    # Tie
+    draw.polygon([
+        (x + int(40 * scale), body_y1 + int(25 * scale)),
+        (x + int(52 * scale), body_y1 + int(50 * scale)),
+        (x + int(40 * scale), body_y1 + int(75 * scale)),
+        (x + int(28 * scale), body_y1 + int(50 * scale)),
+    ], fill=tie)
+
+    # Little mic
+    mic_x = body_x2 - int(30 * scale)
+    mic_y = body_y1 + int(60 * scale)
+    draw.ellipse((mic_x, mic_y, mic_x + int(18 * scale), mic_y + int(18 * scale)), fill=(90, 90, 90), outline=outline)
+    draw.line((mic_x + int(9 * scale), mic_y + int(18 * scale),
+               mic_x + int(9 * scale), mic_y + int(45 * scale)), fill=outline, width=3)
+
+
+@lru_cache(maxsize=None)
+def panel_layer(size: tuple = (W, H)) -> Image.Image:
+    """
+    Dark translucent rounded panel behind the text (full-frame RGBA, read-only).
+    """
+    w, h = size
+    panel = Image.new("RGBA", (w, h), (0, 0, 0, 0))
+    pdraw = ImageDraw.Draw(panel)
+    pdraw.rounded_rectangle(
+        (60, 70, w - 60, h - 70),
+        radius=32,
+        fill=(0, 0, 0, 150),
+        outline=(255, 255, 255, 35),
+        width=2
+    )
+    return panel
+
+
+@lru_cache(maxsize=None)
+def anchor_sprite() -> tuple:
+    """
+    Anchor character + speech bubble pre-rendered once.
+    Returns (RGBA sprite cropped to its bounding box, (x, y) position on the slide).
+    """
+    layer = Image.new("RGBA", (W, H), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(layer)
+    _draw_cute_anchor(draw, CHAR_X, CHAR_Y, scale=CHAR_SCALE)
+
+    # Speech bubble small
+    bubble_x1, bubble_y1, bubble_x2, bubble_y2 = BUBBLE_BOX
+    draw.rounded_rectangle((bubble_x1, bubble_y1, bubble_x2, bubble_y2),
+                           radius=18, fill=(255, 255, 255), outline=(30, 30, 30), width=2)
+    draw.polygon([(bubble_x2, bubble_y1 + 55), (bubble_x2 + 25, bubble_y1 + 75), (bubble_x2, bubble_y1 + 95)],
+                 fill=(255, 255, 255), outline=None)
+    bubble_font = get_font(26, bold=True)
+    draw.text((bubble_x1 + 18, bubble_y1 + 22), "Quick update!", font=bubble_font, fill=(10, 10, 10))
+
+    box = layer.getbbox()
+    return layer.crop(box), (box[0], box[1])
@@ -0,0 +1,68 @@
+import os
+
+from PIL import Image
+
+from stream_encoder import ffmpeg_command, video_frames, write_frames_multi
+
+# Extra outputs next to the main 1280x720 MP4. Video renditions are scaled inside their own
+# ffmpeg process from the shared master frames, so layout and compositing happen only once.
+RENDITIONS = {
+    "vertical": {
+        "size": (1080, 1920),
+        # 16:9 master centred on a blurred, cropped copy of itself (9:16 short)
+        "vf": "split[a][b];"
+              "[a]scale=1080:1920:force_original_aspect_ratio=increase,crop=1080:1920,boxblur=20:2[bg];"
+              "[b]scale=1080:-2[fg];[bg][fg]overlay=(W-w)/2:(H-h)/2",
+        "codec": "libx264",
+        "args": ["-crf", "23"],
+    },
+    "480p": {
+        "size": (854, 480),
+        "vf": "scale=854:480",
+        "codec": "libx264",
+        "args": ["-crf", "28", "-maxrate", "900k", "-bufsize", "1800k"],
+    },
+    "thumb": {
+        "size": (1280, 720),
+        "image": True,  # JPEG of the headline slide
+    },
+}
+
+
+def rendition_path(out_path: str, name: str) -> str:
+    base, ext = os.path.splitext(out_path)
+    return f"{base}_{name}{'.jpg' if RENDITIONS[name].get('image') else ext}"
+
+
+def write_renditions(slides: list[dict], out_path: str, names: list[str], size: tuple, fps: int,
+                     threads: int = None, quality: str = "high") -> dict:
+    """
+    Render the slides once and encode the main video plus every requested rendition from
+    the same frame stream. Returns {"main": out_path, <name>: path, ...}.
+
+    threads is the caller's CPU budget (default: all cores), split between the concurrent
+    encoders (at least one x264 thread each) like write_segmented does.
+    """
+    unknown = [n for n in names if n not in RENDITIONS]
+    if unknown:
+        raise ValueError(f"unknown renditions {unknown}, expected any of {list(RENDITIONS)}")
+
+    paths = {"main": out_path}
+    videos = [n for n in dict.fromkeys(names) if not RENDITIONS[n].get("image")]
+    budget = max(1, threads or os.cpu_count() or 1)
+    per_encoder = max(1, budget // (1 + len(videos)))  # main + video renditions
+    commands = [ffmpeg_command(out_path, size, fps, threads=per_encoder)]
+    for name in dict.fromkeys(names):
+        spec = RENDITIONS[name]
+        path = paths[name] = rendition_path(out_path, name)
+        if spec.get("image"):
+            thumb = Image.fromarray(slides[0]["frame"][:, :, :3])
+            if thumb.size != spec["size"]:
+                thumb = thumb.resize(spec["size"])
+            thumb.save(path, format="JPEG", quality=88)
+            continue
+        commands.append(ffmpeg_command(path, size, fps, codec=spec["codec"], threads=per_encoder,
+                                       extra_args=["-vf", spec["vf"], *spec.get("args", [])]))
+
+    write_frames_multi(video_frames(slides, fps, quality), commands)
+    return paths
@@ -1,5 +1,20 @@
 import re
 
+import numpy as np
+
+OUTRO = "For more updates, stay tuned."
+
+_WORD = re.compile(r"[a-z0-9]+(?:'[a-z]+)?")
+STOPWORDS = frozenset("""
+a about after also an and are as at be been but by can could did do does for from had has have he her
+his how i if in into is it its just more most new no not now of on one or our out over said says she so
+than that the their them then there these they this to up was we were what when which who will with
+would you your
+""".split())
+
+LEAD_BONUS = 0.05       # news puts the gist first: a small tie-breaker towards earlier sentences
+MAX_REDUNDANCY = 0.7    # cosine above which a candidate repeats an already chosen point
+
 def _sentences(text: str):
     text = re.sub(r"\s+", " ", (text or "").strip())
     if not text:
@@ -7,31 +22,107 @@ def _sentences(text: str):
     parts = re.split(r"(?<=[.!?])\s+", text)
     return [p.strip() for p in parts if p.strip()]
 
-def generate_script(news: dict) -> str:
+def _terms(text: str) -> list[str]:
+    return [w for w in _WORD.findall(text.lower()) if w not in STOPWORDS]
+
+def key_points(news_list: list[dict], k: int = 2) -> list[list[str]]:
+    """
+    Extractive summary of many articles in one pass: every description is split into sentences
+    once, sentences become sublinear-TF x IDF vectors (IDF over the whole batch, kept as sparse
+    (sentence, term) pairs in numpy arrays), and each is scored by cosine to its article's centroid
+    (sentences + title). Returns up to k points per article, best first, skipping sentences that
+    repeat the title or an already chosen point; [desc[:140]] if nothing usable is left.
+    """
+    n_docs = len(news_list)
+    sents, sent_doc, sent_pos, sent_len = [], [], [], []
+    tokens = []                      # title terms of every article, then sentence terms
+    title_docs = []                  # article of each title term
+    sent_tokens = []
+    for d, news in enumerate(news_list):
+        title = (news.get("title") or "").strip()
+        terms = _terms(title)
+        tokens += terms
+        title_docs += [d] * len(terms)
+        pos = 0
+        for s in _sentences(news.get("description", "")):
+            s = s.replace("\u00a0", " ").strip()
+            terms = _terms(s)
+            # skip if same as title, or nothing but stopwords / punctuation
+            if not terms or (title and s.lower() in title.lower()):
+                continue
+            sents.append(s)
+            sent_doc.append(d)
+            sent_pos.append(pos)
+            sent_len.append(len(terms))
+            sent_tokens += terms
+            pos += 1
+
+    points = [[] for _ in range(n_docs)]
+    if sents:
+        # term ids for every token at once; the title tokens come first
+        vocab, term_ids = np.unique(np.array(tokens + sent_tokens), return_inverse=True)
+        n_terms = len(vocab)
+        title_cols, cols = term_ids[:len(tokens)], term_ids[len(tokens):]
+        rows = np.repeat(np.arange(len(sents)), sent_len)
+        sent_doc = np.asarray(sent_doc, dtype=np.int64)
+
+        # sentence x term counts as sorted unique (row, col) keys
+        keys, tf = np.unique(rows * n_terms + cols, return_counts=True)
+        r, c = keys // n_terms, keys % n_terms
+        doc_keys = sent_doc[r] * n_terms + c
+
+        # document frequency over articles, not sentences
+        df = np.bincount(np.unique(doc_keys) % n_terms, minlength=n_terms)
+        idf = np.log((1 + n_docs) / (1 + df)) + 1.0
+
+        w = (1.0 + np.log(tf)) * idf[c]
+        w /= np.sqrt(np.bincount(r, weights=w * w, minlength=len(sents)))[r]
+
+        # article centroids: sum of its sentence vectors plus its title terms, normalised
+        title_docs = np.asarray(title_docs, dtype=np.int64)
+        centroid_keys, inverse = np.unique(np.concatenate([doc_keys, title_docs * n_terms + title_cols]),
+                                           return_inverse=True)
+        centroid = np.bincount(inverse, weights=np.concatenate([w, idf[title_cols]]))
+        centroid_doc = centroid_keys // n_terms
+        centroid /= np.sqrt(np.bincount(centroid_doc, weights=centroid * centroid, minlength=n_docs))[centroid_doc]
+
+        score = np.bincount(r, weights=w * centroid[np.searchsorted(centroid_keys, doc_keys)], minlength=len(sents))
+        score += LEAD_BONUS / (1.0 + np.asarray(sent_pos))
+
+        # r is sorted, so each sentence's nonzeros are one contiguous slice
+        bounds = np.searchsorted(r, np.arange(len(sents) + 1))
+
+        def vector(i):
+            return dict(zip(c[bounds[i]:bounds[i + 1]].tolist(), w[bounds[i]:bounds[i + 1]].tolist()))
+
+        chosen = [[] for _ in range(n_docs)]
+        for i in np.lexsort((-score, sent_doc)).tolist():
+            picked = chosen[sent_doc[i]]
+            if len(picked) >= k:
+                continue
+            v = vector(i)
+            if all(sum(x * u.get(t, 0.0) for t, x in v.items()) <= MAX_REDUNDANCY for _, u in picked):
+                picked.append((i, v))
+        points = [[sents[i] for i, _ in picked] for picked in chosen]
+
+    for news, p in zip(news_list, points):
+        desc = (news.get("description") or "").strip()
+        if not p and desc:
+            p.append(desc[:140].strip())
+    return points
+
+def generate_script(news: dict, points: list[str] = None) -> str:
+    """
+    Title, the key points (ranked by key_points unless given) and the outro, one per line.
+    """
     title = news.get("title", "").strip()
-    desc = news.get("description", "").strip()
-
-    # Pick 2 short points from description without repeating title
-    points = []
-    for s in _sentences(desc):
-        s_clean = s.replace("\u00a0", " ").strip()
-        if not s_clean:
-            continue
-        # skip if same as title
-        if title and s_clean.lower() in title.lower():
-            continue
-        points.append(s_clean)
-        if len(points) >= 2:
-            break
-
-    # Fallback if description is weak
-    if len(points) < 2 and desc:
-        points = [desc[:140].strip()] if len(desc) > 0 else points
+    if points is None:
+        points = key_points([news])[0]
 
     # Return a structured script (title + bullets + outro)
     script_lines = [
         title,
         *points,
-        "For more updates, stay tuned."
+        OUTRO
     ]
     return "\n".join([l for l in script_lines if l])
@@ -0,0 +1,109 @@
+import hashlib
+import os
+import shutil
+import subprocess
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import tracing
+from stream_encoder import ffmpeg_exe, write_slides
+
+SEGMENT_CACHE_DIR = os.path.join("output", "cache", "segments")
+
+
+def segment_path(slide: dict, size: tuple, fps: int, quality: str = "high",
+                 cache_dir: str = SEGMENT_CACHE_DIR) -> str:
+    """
+    Cache location for a slide that carries a "cache_key" (its source inputs, e.g. outro source + text).
+    Encoding parameters are part of the hash, so a different fps/size/duration never hits a stale file.
+    """
+    parts = [
+        slide["cache_key"], f"{size[0]}x{size[1]}", fps, quality,
+        slide["duration"], slide.get("zoom"), slide.get("fadein"), slide.get("fadeout"),
+    ]
+    digest = hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()
+    return os.path.join(cache_dir, f"{digest}.mp4")
+
+
+def _encode_segment(slide: dict, path: str, size: tuple, fps: int, threads: int, quality: str) -> str:
+    """
+    Worker entry point: one slide -> one self-contained MP4 segment. Runs in a child process.
+    Written under a temp name first so a crash never leaves a half-written cache entry.
+    """
+    tmp_path = f"{path}.{os.getpid()}.part.mp4"
+    write_slides([slide], tmp_path, size, fps, threads=threads, quality=quality)
+    os.replace(tmp_path, path)
+    return path
+
+
+def concat_segments(paths: list[str], out_path: str) -> str:
+    """
+    Join segments with ffmpeg's concat demuxer (-c copy): no decode, no re-encode.
+    All segments come from the same encoder settings, so their streams line up.
+    """
+    fd, list_path = tempfile.mkstemp(suffix=".txt")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            for p in paths:
+                safe = os.path.abspath(p).replace("'", r"'\''")
+                f.write(f"file '{safe}'\n")
+        cmd = [ffmpeg_exe(), "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+               "-i", list_path, "-c", "copy", out_path]
+        res = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+        if res.returncode != 0:
+            raise RuntimeError(f"ffmpeg concat failed ({res.returncode}): "
+                               f"{res.stderr.decode('utf-8', 'replace').strip()}")
+    finally:
+        os.remove(list_path)
+    return out_path
+
+
+def write_segmented(slides: list[dict], out_path: str, size: tuple, fps: int, workers: int = None,
+                    quality: str = "high", cache_dir: str = SEGMENT_CACHE_DIR, threads: int = None) -> str:
+    """
+    Encode every slide as its own segment in parallel worker processes, then concat losslessly.
+
+    threads is the caller's CPU budget (default: all cores); encoder processes x x264 threads
+    stay within it, so a batch/daemon worker that was given cores // N does not fan out to N x cores.
+
+    Slides with a "cache_key" are stored in cache_dir and reused on later runs
+    (such a slide may come with frame=None when its segment is already cached).
+    The other segments live in a temp dir that is removed afterwards.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(prefix="segments-", dir=os.path.dirname(os.path.abspath(out_path)))
+
+    try:
+        paths, jobs = [], []
+        for i, slide in enumerate(slides):
+            if slide.get("cache_key"):
+                path = segment_path(slide, size, fps, quality, cache_dir)
+                if os.path.exists(path):
+                    tracing.count("cache_hits", cache="segments")
+                    paths.append(path)
+                    continue
+                tracing.count("cache_misses", cache="segments")
+            else:
+                path = os.path.join(tmp_dir, f"{i:03d}.mp4")
+            if slide.get("frame") is None:
+                raise ValueError(f"slide {i} has no frame and no cached segment")
+            paths.append(path)
+            jobs.append((slide, path))
+
+        if jobs:
+            budget = max(1, threads or os.cpu_count() or 1)
+            workers = max(1, min(workers or budget, len(jobs), budget))
+            per_encoder = max(1, budget // workers)
+            if workers == 1:
+                for slide, path in jobs:
+                    _encode_segment(slide, path, size, fps, per_encoder, quality)
+            else:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    futures = [pool.submit(_encode_segment, slide, path, size, fps, per_encoder, quality)
+                               for slide, path in jobs]
+                    for fut in futures:
+                        fut.result()
+
+        return concat_segments(paths, out_path)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
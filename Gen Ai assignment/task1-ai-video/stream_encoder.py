@@ -0,0 +1,127 @@
+import subprocess
+from functools import lru_cache
+
+import numpy as np
+
+from kenburns import zoom_frame_maker
+
+
+@lru_cache(maxsize=None)
+def ffmpeg_exe() -> str:
+    """
+    The ffmpeg binary bundled with imageio-ffmpeg (already a moviepy dependency); probed once per process.
+    """
+    import imageio_ffmpeg
+    return imageio_ffmpeg.get_ffmpeg_exe()
+
+
+def slide_frame_maker(slide: dict, quality: str = "high"):
+    """
+    make_frame(t) for one slide spec: {"frame", "duration", "zoom": (start, rate) | None, ...}
+    """
+    frame = slide["frame"]
+    if slide.get("zoom"):
+        zoom_start, zoom_rate = slide["zoom"]
+        return zoom_frame_maker(frame, slide["duration"], zoom_start=zoom_start, zoom_rate=zoom_rate,
+                                quality=quality)
+    return lambda t: frame
+
+
+def slide_frames(slide: dict, fps: int, quality: str = "high"):
+    """
+    Yield the frames of one slide with fade-in/out applied as in-place blends towards black.
+    Only one scratch frame is allocated per slide, whatever its duration.
+    """
+    make_frame = slide_frame_maker(slide, quality)
+    duration = slide["duration"]
+    fadein = slide.get("fadein") or 0
+    fadeout = slide.get("fadeout") or 0
+    scratch = None
+
+    for i in range(int(duration * fps)):
+        t = i / fps
+        frame = make_frame(t)
+
+        alpha = 1.0
+        if fadein and t < fadein:
+            alpha = min(alpha, t / fadein)
+        if fadeout and duration - t < fadeout:
+            alpha = min(alpha, (duration - t) / fadeout)
+
+        if alpha >= 1.0:
+            yield frame
+            continue
+
+        if scratch is None:
+            scratch = np.empty_like(frame)
+        np.multiply(frame, alpha, out=scratch, casting="unsafe")
+        yield scratch
+
+
+def video_frames(slides: list[dict], fps: int, quality: str = "high"):
+    for slide in slides:
+        yield from slide_frames(slide, fps, quality)
+
+
+def ffmpeg_command(out_path: str, size: tuple, fps: int, codec: str = "libx264", threads: int = None,
+                   preset: str = "medium", extra_args: list = None) -> list[str]:
+    w, h = size
+    cmd = [
+        ffmpeg_exe(), "-y", "-loglevel", "error",
+        "-f", "rawvideo", "-pix_fmt", "rgb24", "-s", f"{w}x{h}", "-r", str(fps), "-i", "-",
+        "-an", "-c:v", codec, "-preset", preset, "-pix_fmt", "yuv420p",
+    ]
+    if threads:
+        cmd += ["-threads", str(threads)]
+    cmd += list(extra_args or [])
+    cmd.append(out_path)
+    return cmd
+
+
+def write_frames_multi(frames, commands: list[list[str]]):
+    """
+    Pipe each raw RGB frame from an iterator into several ffmpeg subprocesses at once.
+    Every frame is produced once; the encoders run concurrently in their own processes.
+    """
+    procs = [subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=subprocess.PIPE) for cmd in commands]
+    alive = list(procs)
+    try:
+        for frame in frames:
+            data = np.ascontiguousarray(frame, dtype=np.uint8).data
+            for proc in list(alive):
+                try:
+                    proc.stdin.write(data)
+                except BrokenPipeError:
+                    alive.remove(proc)  # this ffmpeg died early; its stderr below says why
+            if not alive:
+                break
+    finally:
+        errors = []
+        for proc in procs:
+            try:
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass
+        for proc, cmd in zip(procs, commands):
+            err = proc.stderr.read().decode("utf-8", "replace").strip()
+            proc.wait()
+            if proc.returncode != 0:
+                errors.append(f"{cmd[-1]}: ffmpeg failed ({proc.returncode}): {err}")
+
+    if errors:
+        raise RuntimeError("; ".join(errors))
+
+
+def write_frames(frames, out_path: str, size: tuple, fps: int, codec: str = "libx264", threads: int = None,
+                 preset: str = "medium") -> str:
+    """
+    Pipe raw RGB frames from an iterator straight into an ffmpeg subprocess.
+    Nothing is buffered on the Python side, so memory stays flat for any video length.
+    """
+    write_frames_multi(frames, [ffmpeg_command(out_path, size, fps, codec=codec, threads=threads, preset=preset)])
+    return out_path
+
+
+def write_slides(slides: list[dict], out_path: str, size: tuple, fps: int, threads: int = None,
+                 quality: str = "high") -> str:
+    return write_frames(video_frames(slides, fps, quality), out_path, size, fps, threads=threads)
@@ -0,0 +1,133 @@
+from functools import lru_cache
+
+from overlays import get_font
+
+# body font sizes layout_bullets tries, largest first
+BODY_SIZES = (42, 38, 34, 30, 26, 24)
+
+BULLET = "• "
+ELLIPSIS = "…"
+
+# (size, bold) -> {char: advance in px}
+_glyph_widths = {}
+
+
+def _advances(size: int, bold: bool) -> dict:
+    key = (size, bold)
+    widths = _glyph_widths.get(key)
+    if widths is None:
+        widths = _glyph_widths[key] = {}
+    return widths
+
+
+def text_width(text: str, size: int, bold: bool = False) -> float:
+    """
+    Pixel width of text as the sum of per-glyph advances, each measured once per font size.
+    (Pillow's basic layout does not kern, so this matches draw.text without raqm.)
+    """
+    widths = _advances(size, bold)
+    total = 0.0
+    for ch in text:
+        w = widths.get(ch)
+        if w is None:
+            w = widths[ch] = get_font(size, bold).getlength(ch)
+        total += w
+    return total
+
+
+def _break_word(word: str, widths: list[float], size: int, bold: bool) -> list[str]:
+    """
+    Split a single word that is wider than the line on its own; chunk i gets widths[i] (last repeats).
+    """
+    parts, cur, cur_w = [], "", 0.0
+    for ch in word:
+        w = text_width(ch, size, bold)
+        if cur and cur_w + w > widths[min(len(parts), len(widths) - 1)]:
+            parts.append(cur)
+            cur, cur_w = "", 0.0
+        cur += ch
+        cur_w += w
+    if cur:
+        parts.append(cur)
+    return parts
+
+
+@lru_cache(maxsize=4096)
+def wrap_text(text: str, widths: tuple, size: int, bold: bool = False) -> tuple:
+    """
+    Greedy line break of text. widths[i] is the pixel budget of line i; the last one repeats
+    (so `(850,)` wraps everything to 850 px). Returns a tuple of lines.
+    """
+    def width_of(i):
+        return widths[min(i, len(widths) - 1)]
+
+    space = text_width(" ", size, bold)
+    lines, cur, cur_w = [], [], 0.0
+    for word in (text or "").split():
+        w = text_width(word, size, bold)
+        if cur and cur_w + space + w > width_of(len(lines)):
+            lines.append(" ".join(cur))
+            cur, cur_w = [], 0.0
+        if not cur and w > width_of(len(lines)):
+            # a single word wider than the line on its own
+            chunks = _break_word(word, [width_of(i) for i in range(len(lines), len(widths))] or [widths[-1]],
+                                 size, bold)
+            lines.extend(chunks[:-1])
+            word, w = chunks[-1], text_width(chunks[-1], size, bold)
+        cur_w = w if not cur else cur_w + space + w
+        cur.append(word)
+    if cur:
+        lines.append(" ".join(cur))
+    return tuple(lines)
+
+
+def _ellipsize(line: str, max_width: float, size: int, bold: bool) -> str:
+    while line and text_width(line + ELLIPSIS, size, bold) > max_width:
+        line = line[:-1]
+    return line.rstrip() + ELLIPSIS
+
+
+@lru_cache(maxsize=1024)
+def layout_bullets(bullets: tuple, max_width: int, max_height: int, sizes: tuple = BODY_SIZES,
+                   bold: bool = False, narrow: tuple = None) -> dict:
+    """
+    Fit bullet points into a (max_width x max_height) box.
+    narrow=(until_y, width) limits lines that start above until_y (e.g. beside the speech bubble).
+
+    Tries each font size from largest to smallest and keeps the first one where every bullet
+    fits completely; if none does, the smallest size is used and the text is cut with an ellipsis.
+    Returns {"size", "line_height", "lines": ((dx, dy, text), ...)} relative to the box origin
+    (cached and shared: treat it as read-only).
+    """
+    bullets = tuple(b.strip() for b in bullets if b and b.strip())
+    for size in sizes:
+        line_h = round(size * 58 / 42)
+        gap = round(size * 10 / 42)
+        indent = text_width(BULLET, size, bold)
+
+        lines, y, fits = [], 0, True
+        for bullet in bullets:
+            widths = []
+            if narrow:
+                until_y, narrow_width = narrow
+                widths = [narrow_width - indent] * max(0, -(-(until_y - y) // line_h))
+            widths = tuple(widths) + (max_width - indent,)
+            for i, text in enumerate(wrap_text(bullet, widths, size, bold)):
+                if y + line_h > max_height:
+                    fits = False
+                    break
+                lines.append((0 if i == 0 else round(indent), y, (BULLET + text) if i == 0 else text))
+                y += line_h
+            if not fits:
+                break
+            y += gap
+
+        if fits:
+            break
+
+    if not fits and lines:
+        # Nothing fits even at the smallest size: mark the cut on the last visible line
+        dx, dy, text = lines[-1]
+        line_width = narrow[1] if narrow and dy < narrow[0] else max_width
+        lines[-1] = (dx, dy, _ellipsize(text, line_width - dx, size, bold))
+    return {"size": size, "line_height": line_h, "lines": tuple(lines)}
@@ -0,0 +1,227 @@
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+TRACE_DIR = os.path.join("output", "trace")
+METRIC_PREFIX = "newsvideo"
+
+_lock = threading.Lock()
+_state = {"enabled": False, "started": 0.0, "spans": [], "counters": {}, "errors": []}
+_local = threading.local()
+
+
+def enable():
+    """
+    Start collecting. Until this is called every helper below is a cheap no-op.
+    """
+    with _lock:
+        _state.update(enabled=True, started=time.time(), spans=[], counters={}, errors=[])
+
+
+def enabled() -> bool:
+    return _state["enabled"]
+
+
+def peak_rss_bytes():
+    """
+    Peak resident set size of this process (None if the platform does not tell us).
+    """
+    if resource is not None:
+        rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return rss if sys.platform == "darwin" else rss * 1024
+    try:
+        import ctypes
+        from ctypes import wintypes
+
+        class Counters(ctypes.Structure):
+            _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                        ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                        ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                        ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                        ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t)]
+
+        counters = Counters()
+        counters.cb = ctypes.sizeof(counters)
+        handle = ctypes.windll.kernel32.GetCurrentProcess()
+        if ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+            return counters.PeakWorkingSetSize
+    except (ImportError, AttributeError, OSError):
+        pass
+    return None
+
+
+def _key(name: str, labels: dict) -> str:
+    return name + "".join(f"|{k}={v}" for k, v in sorted(labels.items()))
+
+
+def count(name: str, value: float = 1, **labels):
+    """
+    Add to a counter, e.g. count("bytes_downloaded", n, kind="image") or count("cache_hits", cache="images").
+    """
+    if not _state["enabled"]:
+        return
+    key = _key(name, labels)
+    with _lock:
+        _state["counters"][key] = _state["counters"].get(key, 0) + value
+
+
+def record_exception(where: str, exc: BaseException):
+    """
+    Note an exception the code deliberately swallows (fallbacks keep working, but now they are visible).
+    """
+    if not _state["enabled"]:
+        return
+    span = getattr(_local, "stack", None)
+    with _lock:
+        _state["errors"].append({"where": where, "span": span[-1] if span else None,
+                                 "type": type(exc).__name__, "message": str(exc)[:300], "at": time.time()})
+        key = _key("swallowed_exceptions", {"where": where})
+        _state["counters"][key] = _state["counters"].get(key, 0) + 1
+
+
+@contextmanager
+def span(name: str, **attrs):
+    """
+    Time a stage: wall time, CPU time of this process and of finished child processes (ffmpeg),
+    counter deltas while it ran, and peak RSS at the end. Spans nest; names become "outer/inner".
+    """
+    if not _state["enabled"]:
+        yield
+        return
+    stack = _local.__dict__.setdefault("stack", [])
+    full = f"{stack[-1]}/{name}" if stack else name
+    stack.append(full)
+    with _lock:
+        before = dict(_state["counters"])
+    t0, cpu0, times0 = time.perf_counter(), time.process_time(), os.times()
+    error = None
+    try:
+        yield
+    except BaseException as e:
+        error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        times1 = os.times()
+        record = {
+            "name": full,
+            "wall_seconds": time.perf_counter() - t0,
+            "cpu_seconds": time.process_time() - cpu0,
+            "child_cpu_seconds": (times1.children_user + times1.children_system)
+                                 - (times0.children_user + times0.children_system),
+            "peak_rss_bytes": peak_rss_bytes(),
+            "attrs": attrs,
+        }
+        with _lock:
+            record["counters"] = {k: v - before.get(k, 0) for k, v in _state["counters"].items()
+                                  if v != before.get(k, 0)}
+            if error:
+                record["error"] = error
+            _state["spans"].append(record)
+        stack.pop()
+
+
+def merge(data: dict, **attrs):
+    """
+    Fold a report from a worker process (see batch._render_one) into this one; attrs tag its spans.
+    """
+    if not _state["enabled"]:
+        return
+    with _lock:
+        for s in data["spans"]:
+            _state["spans"].append(dict(s, attrs={**s.get("attrs", {}), **attrs}))
+        for key, value in data["counters"].items():
+            _state["counters"][key] = _state["counters"].get(key, 0) + value
+        _state["errors"] += [dict(e, **attrs) for e in data["swallowed_exceptions"]]
+
+
+def report() -> dict:
+    with _lock:
+        return {
+            "started_at": _state["started"],
+            "finished_at": time.time(),
+            "pid": os.getpid(),
+            "peak_rss_bytes": peak_rss_bytes(),
+            "spans": list(_state["spans"]),
+            "counters": dict(_state["counters"]),
+            "swallowed_exceptions": list(_state["errors"]),
+        }
+
+
+def _prom_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    inner = ",".join('{}="{}"'.format(k, str(v).replace("\\", "\\\\").replace('"', '\\"')) for k, v in labels.items())
+    return "{" + inner + "}"
+
+
+def _prom_value(value) -> str:
+    """
+    Exact sample value: integers (byte counts, RSS) as integers, floats at full precision.
+    """
+    if isinstance(value, int) or (isinstance(value, float) and value.is_integer()):
+        return str(int(value))
+    return repr(float(value))
+
+
+def to_prometheus(data: dict) -> str:
+    """
+    Prometheus text exposition of a report (for the node_exporter textfile collector or a pushgateway).
+    """
+    metrics = {}  # name -> (type, help, [(labels, value)])
+
+    def add(name, kind, help_text, labels, value):
+        metrics.setdefault(f"{METRIC_PREFIX}_{name}", (kind, help_text, []))[2].append((labels, value))
+
+    totals = {}
+    for s in data["spans"]:
+        t = totals.setdefault(s["name"], [0.0, 0.0, 0.0])
+        t[0] += s["wall_seconds"]
+        t[1] += s["cpu_seconds"]
+        t[2] += s["child_cpu_seconds"]
+    for name, (wall, cpu, child) in totals.items():
+        add("stage_wall_seconds", "gauge", "Wall time spent in the stage during the run", {"stage": name}, wall)
+        add("stage_cpu_seconds", "gauge", "CPU time of this process during the stage", {"stage": name}, cpu)
+        add("stage_child_cpu_seconds", "gauge", "CPU time of child processes (ffmpeg) during the stage",
+            {"stage": name}, child)
+    for key, value in data["counters"].items():
+        name, *pairs = key.split("|")
+        add(f"{name}_total", "counter", name.replace("_", " ").capitalize(), dict(p.split("=", 1) for p in pairs), value)
+    if data["peak_rss_bytes"] is not None:
+        add("peak_rss_bytes", "gauge", "Peak resident set size of the process", {}, data["peak_rss_bytes"])
+    add("run_duration_seconds", "gauge", "Duration of the run", {}, data["finished_at"] - data["started_at"])
+
+    lines = []
+    for name, (kind, help_text, samples) in metrics.items():
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+        lines += [f"{name}{_prom_labels(labels)} {_prom_value(value)}" for labels, value in samples]
+    return "\n".join(lines) + "\n"
+
+
+def write_report(out_dir: str = TRACE_DIR, name: str = None) -> tuple:
+    """
+    Write <name>.json and <name>.prom for everything collected so far; returns both paths.
+    latest.prom is overwritten as well, for a textfile collector that reads a fixed path.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    name = name or time.strftime("trace-%Y%m%d-%H%M%S")
+    data = report()
+    json_path = os.path.join(out_dir, f"{name}.json")
+    prom_path = os.path.join(out_dir, f"{name}.prom")
+    with open(json_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+    prom = to_prometheus(data)
+    with open(prom_path, "w", encoding="utf-8") as f:
+        f.write(prom)
+    latest = os.path.join(out_dir, "latest.prom")
+    with open(f"{latest}.part", "w", encoding="utf-8") as f:
+        f.write(prom)
+    os.replace(f"{latest}.part", latest)
+    return json_path, prom_path
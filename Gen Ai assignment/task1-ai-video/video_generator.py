@@ -1,63 +1,20 @@
 import os
 import re
-import textwrap
-import requests
 import numpy as np
-from io import BytesIO
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageDraw
 
-from moviepy.editor import ImageClip, concatenate_videoclips, vfx
+import tracing
+from image_assets import fetch_many
+from kenburns import zoom_for
+from overlays import BUBBLE_BOX, anchor_sprite, get_font, panel_layer
+from renditions import write_renditions
+from segments import segment_path, write_segmented
+from stream_encoder import slide_frame_maker, write_slides
+from text_layout import layout_bullets
 
 W, H = 1280, 720
 
-# Pillow resampling compatibility (works across versions)
-try:
-    RESAMPLE = Image.Resampling.LANCZOS
-except AttributeError:
-    RESAMPLE = Image.LANCZOS
-
-
-def _get_font(size=46, bold=False):
-    candidates = [
-        r"C:\Windows\Fonts\arialbd.ttf" if bold else r"C:\Windows\Fonts\arial.ttf",
-        r"C:\Windows\Fonts\calibri.ttf",
-    ]
-    for p in candidates:
-        if os.path.exists(p):
-            try:
-                return ImageFont.truetype(p, size)
-            except:
-                pass
-    return ImageFont.load_default()
-
-
-def _fetch_bg_image(query: str) -> Image.Image:
-    """
-    Free source endpoint (no API key): https://source.unsplash.com/1280x720/?<query>
-    Query improves relevance but Unsplash source is still random-ish.
-    """
-    q = re.sub(r"[^a-zA-Z0-9\s-]", "", query or "").strip().replace(" ", ",")
-    url = f"https://source.unsplash.com/{W}x{H}/?{q if q else 'news'}"
-    try:
-        r = requests.get(url, timeout=12)
-        r.raise_for_status()
-        img = Image.open(BytesIO(r.content)).convert("RGB")
-        return img.resize((W, H), RESAMPLE)
-    except:
-        return Image.new("RGB", (W, H), (12, 12, 12))
-
-
-def _fetch_image_from_url(img_url: str) -> Image.Image:
-    """
-    Fetch the actual article image (og:image) => truly topic-based.
-    """
-    try:
-        r = requests.get(img_url, timeout=12, headers={"User-Agent": "Mozilla/5.0"})
-        r.raise_for_status()
-        img = Image.open(BytesIO(r.content)).convert("RGB")
-        return img.resize((W, H), RESAMPLE)
-    except:
-        return None
+ENGINES = ("stream", "segments", "moviepy")
 
 
 def _chunk_script(script_text: str) -> list[str]:
@@ -83,73 +40,6 @@ def _dedupe_lines(lines: list[str]) -> list[str]:
     return out
 
 
-def _draw_cute_anchor(draw: ImageDraw.ImageDraw, x: int, y: int, scale: float = 1.0):
-    """
-    Draw a simple cute cartoon character (news anchor) with a speech bubble vibe.
-    No external assets required.
-    """
-    # Colors
-    skin = (255, 220, 190)
-    hair = (35, 35, 35)
-    suit = (35, 90, 160)
-    shirt = (245, 245, 245)
-    tie = (220, 70, 70)
-    outline = (20, 20, 20)
-
-    # Sizes
-    head_r = int(52 * scale)
-    body_w = int(140 * scale)
-    body_h = int(170 * scale)
-
-    # Head
-    cx, cy = x + head_r, y + head_r
-    draw.ellipse((x, y, x + 2 * head_r, y + 2 * head_r), fill=skin, outline=outline, width=3)
-
-    # Hair
-    draw.pieslice((x - 6, y - 10, x + 2 * head_r + 6, y + 2 * head_r + 10),
-                  start=200, end=360, fill=hair, outline=None)
-
-    # Eyes
-    eye_y = y + int(55 * scale)
-    draw.ellipse((x + int(35 * scale), eye_y, x + int(48 * scale), eye_y + int(13 * scale)), fill=outline)
-    draw.ellipse((x + int(70 * scale), eye_y, x + int(83 * scale), eye_y + int(13 * scale)), fill=outline)
-
-    # Smile
-    smile_y = y + int(85 * scale)
-    draw.arc((x + int(38 * scale), smile_y, x + int(92 * scale), smile_y + int(40 * scale)),
-             start=10, end=170, fill=outline, width=3)
-
-    # Body (suit)
-    body_x1 = x - int(18 * scale)
-    body_y1 = y + 2 * head_r - int(5 * scale)
-    body_x2 = body_x1 + body_w
-    body_y2 = body_y1 + body_h
-    draw.rounded_rectangle((body_x1, body_y1, body_x2, body_y2), radius=int(22 * scale),
-                           fill=suit, outline=outline, width=3)
-
-    # Shirt triangle
-    draw.polygon([
-        (x + int(25 * scale), body_y1 + int(10 * scale)),
-        (x + int(55 * scale), body_y1 + int(10 * scale)),
-        (x + int(40 * scale), body_y1 + int(70 * scale)),
-    ], fill=shirt)
-
-    # Tie
-    draw.polygon([
-        (x + int(40 * scale), body_y1 + int(25 * scale)),
-        (x + int(52 * scale), body_y1 + int(50 * scale)),
-        (x + int(40 * scale), body_y1 + int(75 * scale)),
-        (x + int(28 * scale), body_y1 + int(50 * scale)),
-    ], fill=tie)
-
-    # Little mic
-    mic_x = body_x2 - int(30 * scale)
-    mic_y = body_y1 + int(60 * scale)
-    draw.ellipse((mic_x, mic_y, mic_x + int(18 * scale), mic_y + int(18 * scale)), fill=(90, 90, 90), outline=outline)
-    draw.line((mic_x + int(9 * scale), mic_y + int(18 * scale),
-               mic_x + int(9 * scale), mic_y + int(45 * scale)), fill=outline, width=3)
-
-
 def _render_slide(
     title: str,
     body_lines: list[str],
@@ -157,25 +47,12 @@ def _render_slide(
     source: str = "News",
     show_character: bool = True
 ) -> np.ndarray:
-    img = bg.copy().convert("RGB")
-    draw = ImageDraw.Draw(img)
-
-    # Dark overlay panel for readability
-    panel = Image.new("RGBA", (W, H), (0, 0, 0, 0))
-    pdraw = ImageDraw.Draw(panel)
-    pdraw.rounded_rectangle(
-        (60, 70, W - 60, H - 70),
-        radius=32,
-        fill=(0, 0, 0, 150),
-        outline=(255, 255, 255, 35),
-        width=2
-    )
-    img = Image.alpha_composite(img.convert("RGBA"), panel).convert("RGB")
+    # Dark overlay panel for readability (cached layer)
+    img = Image.alpha_composite(bg.convert("RGBA"), panel_layer((W, H))).convert("RGB")
     draw = ImageDraw.Draw(img)
 
-    title_font = _get_font(60, bold=True)
-    body_font = _get_font(42, bold=False)
-    src_font = _get_font(30, bold=True)
+    title_font = get_font(60, bold=True)
+    src_font = get_font(30, bold=True)
 
     # Layout: reserve right area for character
     left_x = 100
@@ -189,46 +66,102 @@ def _render_slide(
     source_text = f"Source: {source}"
     draw.text((W - 520, 125), source_text, font=src_font, fill=(220, 220, 220))
 
-    # Body bullets (wrapped)
-    y = 215
-    for line in body_lines:
-        line = (line or "").strip()
-        if not line:
-            continue
-
-        wrapped = textwrap.wrap(line, width=44)  # approximate; panel + fonts vary
-        for i, wline in enumerate(wrapped[:2]):  # keep it neat
-            prefix = "• " if i == 0 else "  "
-            draw.text((left_x, y), f"{prefix}{wline}", font=body_font, fill=(245, 245, 245))
-            y += 58
-        y += 10
-        if y > H - 160:
-            break
+    # Body bullets: wrapped to max_text_width in pixels, font shrinks until everything fits
+    body_top, body_bottom = 215, H - 90
+    # lines beside the speech bubble stop short of it
+    narrow = (BUBBLE_BOX[3] - body_top, BUBBLE_BOX[0] - 20 - left_x) if show_character else None
+    layout = layout_bullets(tuple(body_lines), max_text_width, body_bottom - body_top, narrow=narrow)
+    body_font = get_font(layout["size"], bold=False)
+    for dx, dy, text in layout["lines"]:
+        draw.text((left_x + dx, body_top + dy), text, font=body_font, fill=(245, 245, 245))
 
-    # Cute character on right
+    # Cute character + speech bubble on right (cached sprite, composited over its bbox only)
     if show_character:
-        # Position the anchor to the right within the panel
-        char_x = W - 280
-        char_y = 230
-        _draw_cute_anchor(draw, char_x, char_y, scale=1.05)
-
-        # Speech bubble small
-        bubble_x1, bubble_y1 = W - 520, 210
-        bubble_x2, bubble_y2 = W - 290, 310
-        draw.rounded_rectangle((bubble_x1, bubble_y1, bubble_x2, bubble_y2),
-                               radius=18, fill=(255, 255, 255, 235), outline=(30, 30, 30), width=2)
-        draw.polygon([(bubble_x2, bubble_y1 + 55), (bubble_x2 + 25, bubble_y1 + 75), (bubble_x2, bubble_y1 + 95)],
-                     fill=(255, 255, 255, 235), outline=None)
-        bubble_font = _get_font(26, bold=True)
-        draw.text((bubble_x1 + 18, bubble_y1 + 22), "Quick update!", font=bubble_font, fill=(10, 10, 10))
+        sprite, pos = anchor_sprite()
+        img.paste(sprite, pos, sprite)
 
     return np.array(img)
 
 
-def create_video(script_text: str, news: dict = None, total_duration_sec: int = 45, fps: int = 24) -> str:
-    os.makedirs("output", exist_ok=True)
-    out_path = os.path.join("output", "news_video.mp4")
+def _write_with_moviepy(slides: list[dict], out_path: str, fps: int, threads: int = None, quality: str = "high"):
+    # moviepy.editor drags in IPython & co. (~0.6s); only the moviepy engine needs it
+    from moviepy.editor import ImageClip, VideoClip, concatenate_videoclips, vfx
+
+    clips = []
+    for slide in slides:
+        if slide["zoom"]:
+            clip = VideoClip(slide_frame_maker(slide, quality), duration=slide["duration"])
+        else:
+            clip = ImageClip(slide["frame"]).set_duration(slide["duration"])
+        clips.append(clip.fx(vfx.fadein, slide["fadein"]).fx(vfx.fadeout, slide["fadeout"]))
+
+    final = concatenate_videoclips(clips, method="chain")
+    final.write_videofile(out_path, fps=fps, codec="libx264", audio=False, threads=threads)
+
+
+def create_video(
+    script_text: str = None,
+    news: dict = None,
+    total_duration_sec: int = 45,
+    fps: int = 24,
+    out_path: str = None,
+    threads: int = None,
+    zoom_quality: str = "high",
+    engine: str = "stream",
+    renditions: list[str] = None,
+    points: list[str] = None
+) -> str:
+    """
+    Render the news video to out_path.
+
+    engine="stream" pipes frames straight into ffmpeg (flat memory for any length);
+    engine="segments" encodes each slide in parallel and concats them without re-encoding,
+    reusing the cached outro segment across runs;
+    engine="moviepy" is the original clip/concatenate path.
+
+    renditions (stream engine only) adds outputs from the same render pass, e.g.
+    ["vertical", "480p", "thumb"] -> news_video_vertical.mp4, news_video_480p.mp4, news_video_thumb.jpg.
 
+    points (script_generator.key_points) are laid out as the key points as-is; otherwise they
+    are re-split from script_text.
+    """
+    if engine not in ENGINES:
+        raise ValueError(f"engine must be one of {ENGINES}, got {engine!r}")
+    if renditions and engine != "stream":
+        raise ValueError("renditions are produced by the stream engine only")
+    if not out_path:
+        out_path = os.path.join("output", "news_video.mp4")
+    os.makedirs(os.path.dirname(out_path) or ".", exist_ok=True)
+
+    with tracing.span("slides"):
+        slides = build_slides(script_text, news, total_duration_sec, fps, zoom_quality, engine, points)
+
+    with tracing.span("encode", engine=engine, renditions=len(renditions or [])):
+        if engine == "stream" and renditions:
+            write_renditions(slides, out_path, renditions, (W, H), fps, threads=threads, quality=zoom_quality)
+        elif engine == "stream":
+            write_slides(slides, out_path, (W, H), fps, threads=threads, quality=zoom_quality)
+        elif engine == "segments":
+            write_segmented(slides, out_path, (W, H), fps, quality=zoom_quality, threads=threads)
+        else:
+            _write_with_moviepy(slides, out_path, fps, threads=threads, quality=zoom_quality)
+
+    return out_path
+
+def build_slides(
+    script_text: str = None,
+    news: dict = None,
+    total_duration_sec: int = 45,
+    fps: int = 24,
+    zoom_quality: str = "high",
+    engine: str = "stream",
+    points: list[str] = None
+) -> list[dict]:
+    """
+    Fetch backgrounds and render the three slide stills (headline, key points, outro) as the
+    slide dicts every writer takes. With engine="segments" and a cached outro segment, the
+    outro still is not rendered (its "frame" stays None).
+    """
     source = "News"
     headline = ""
     image_url = ""
@@ -237,8 +170,8 @@ def create_video(script_text: str, news: dict = None, total_duration_sec: int =
         headline = news.get("title") or ""
         image_url = news.get("image_url") or ""
 
-    # Extract sentences, build bullet list, dedupe
-    sentences = _chunk_script(script_text)
+    # Extract sentences (unless the summarizer already ranked them), build bullet list, dedupe
+    sentences = list(points) if points is not None else _chunk_script(script_text)
     if not sentences:
         sentences = [headline] if headline else ["Breaking News.", "Stay tuned for more updates."]
 
@@ -263,45 +196,48 @@ def create_video(script_text: str, news: dict = None, total_duration_sec: int =
 
     outro = "For more updates, stay tuned."
 
-    # Topic-based background: use article OG image first, else keyword search
-    article_img = _fetch_image_from_url(image_url) if image_url else None
-
-    # Build clips
-    clips = []
-
-    # Slide 1: headline
-    bg1 = article_img if article_img is not None else _fetch_bg_image(bullets[0])
-    frame1 = _render_slide("Breaking News", [bullets[0]], bg1, source=source, show_character=True)
-    c1 = ImageClip(frame1).set_duration(6)
-    c1 = c1.fx(vfx.resize, lambda t: 1.0 + 0.03 * t).fx(vfx.fadein, 0.6).fx(vfx.fadeout, 0.6)
-    clips.append(c1)
-
-    # Slide 2: key points (avoid repeating headline if possible)
+    # Slide 2 content (avoid repeating headline if possible)
     key_points = bullets[1:4] if len(bullets) > 1 else bullets[:2]
     key_points = _dedupe_lines(key_points)
     if not key_points:
         key_points = [bullets[0]]
-
     topic_query = " ".join(key_points[:2])
-    bg2 = article_img if article_img is not None else _fetch_bg_image(topic_query)
-    frame2 = _render_slide("Key Points", key_points[:3], bg2, source=source, show_character=True)
-    c2 = ImageClip(frame2).set_duration(10).fx(vfx.fadein, 0.6).fx(vfx.fadeout, 0.6)
-    c2 = c2.fx(vfx.resize, lambda t: 1.02 + 0.02 * t)
-    clips.append(c2)
 
-    # Slide 3: outro
-    bg3 = _fetch_bg_image(f"{source} news update")
-    frame3 = _render_slide("That’s it!", [outro], bg3, source=source, show_character=True)
-    c3 = ImageClip(frame3).set_duration(6).fx(vfx.fadein, 0.6).fx(vfx.fadeout, 0.8)
-    clips.append(c3)
+    # Slide durations: the middle slide absorbs whatever is left of total_duration_sec
+    d1, d2, d3 = 6, 10, 6
+    d2 += max(0, total_duration_sec - (d1 + d2 + d3))
+
+    # Slide 3: outro (identical for every story from the same source -> cacheable segment)
+    outro_query = f"{source} news update"
+    slide3 = {"frame": None, "duration": d3, "zoom": None, "fadein": 0.6, "fadeout": 0.8,
+              "cache_key": ("outro", source, "That’s it!", outro, outro_query)}
+    need_outro = not (engine == "segments" and os.path.exists(segment_path(slide3, (W, H), fps, zoom_quality)))
+
+    # Topic-based background: use article OG image first, else keyword search.
+    # Everything a round needs is fetched concurrently and cached on disk.
+    with tracing.span("images"):
+        images = fetch_many(urls=[image_url], queries=[outro_query] if need_outro else [], size=(W, H))
+        article_img = images.get(("url", image_url))
+        if article_img is None:
+            images.update(fetch_many(queries=[bullets[0], topic_query], size=(W, H)))
+    if article_img is not None:
+        bg1 = bg2 = article_img
+    else:
+        bg1, bg2 = images[("query", bullets[0])], images[("query", topic_query)]
+
+    slides = []
 
-    # Adjust total duration by extending middle slide
-    base = sum(c.duration for c in clips)
-    if base < total_duration_sec:
-        extra = total_duration_sec - base
-        clips[1] = clips[1].set_duration(clips[1].duration + extra)
+    # Slide 1: headline
+    frame1 = _render_slide("Breaking News", [bullets[0]], bg1, source=source, show_character=True)
+    slides.append({"frame": frame1, "duration": d1, "zoom": zoom_for(d1, 1.0, 0.03), "fadein": 0.6, "fadeout": 0.6})
 
-    final = concatenate_videoclips(clips, method="compose")
-    final.write_videofile(out_path, fps=fps, codec="libx264", audio=False)
+    # Slide 2: key points
+    frame2 = _render_slide("Key Points", key_points[:3], bg2, source=source, show_character=True)
+    slides.append({"frame": frame2, "duration": d2, "zoom": zoom_for(d2, 1.02, 0.02), "fadein": 0.6, "fadeout": 0.6})
 
-    return out_path
+    # Slide 3: outro
+    if need_outro:
+        bg3 = images[("query", outro_query)]
+        slide3["frame"] = _render_slide("That’s it!", [outro], bg3, source=source, show_character=True)
+    slides.append(slide3)
+    return slides
@@ -0,0 +1,58 @@
+import os
+import time
+
+import tracing
+from batch import render_stories, write_manifest
+from feed_store import FEED_DB_PATH, FeedStore
+from news_scraper import FEED_URL, poll_feed
+
+WATCH_DIR = os.path.join("output", "watch")
+
+
+def poll_and_render(store: FeedStore, feed_url: str = FEED_URL, limit: int = None, workers: int = None,
+                    out_root: str = WATCH_DIR, **render_opts):
+    """
+    One watch cycle: render only new or changed stories. Returns the manifest path, or None if idle.
+    A story is recorded as processed only once its video rendered successfully, so failures retry;
+    the feed's ETag / Last-Modified are saved only when nothing failed, otherwise the next poll
+    would get a 304 and never see the failed story again.
+    """
+    fresh, validators = poll_feed(store, feed_url=feed_url, limit=limit)
+    if not fresh:
+        store.set_validators(feed_url, *validators)
+        return None
+
+    out_dir = os.path.join(out_root, time.strftime("%Y%m%d-%H%M%S"))
+    entries = render_stories([f["news"] for f in fresh], out_dir, workers=workers, **render_opts)
+    for item, entry in zip(fresh, entries):
+        entry["entry_id"] = item["id"]
+        if entry["status"] == "ok":
+            store.mark_processed(item["id"], item["hash"], title=entry["title"], output=entry["output"])
+    if all(entry["status"] == "ok" for entry in entries):
+        store.set_validators(feed_url, *validators)
+    return write_manifest(entries, out_dir, workers=workers or os.cpu_count())
+
+
+def run_watch(interval: int = 300, feed_url: str = FEED_URL, limit: int = None, workers: int = None,
+              db_path: str = FEED_DB_PATH, once: bool = False, **render_opts):
+    """
+    Poll the feed every `interval` seconds and send new/changed stories to the video pipeline.
+    """
+    store = FeedStore(db_path)
+    try:
+        while True:
+            with tracing.span("poll"):
+                manifest_path = poll_and_render(store, feed_url=feed_url, limit=limit, workers=workers, **render_opts)
+            if manifest_path:
+                print("📦 New stories rendered, manifest:", manifest_path)
+            else:
+                print("💤 No new stories")
+            if tracing.enabled():
+                # one report per poll cycle, then start counting afresh
+                print("📈 Trace written to:", tracing.write_report()[0])
+                tracing.enable()
+            if once:
+                return manifest_path
+            time.sleep(interval)
+    finally:
+        store.close()
@@ -0,0 +1,141 @@
+"""
+Persistent render worker: one warm interpreter serves many short jobs, so the imports,
+font loading and ffmpeg probe are paid once instead of per invocation.
+
+Jobs are JSON lines on stdin (or a file), one result line per job on stdout:
+
+    {"id": "a1", "news": {"title": ..., "description": ..., "source": ..., "image_url": ...}}
+    {"id": "a2", "script": "Already written script.", "news": {...}, "options": {"engine": "segments"}}
+    {"id": "a3"}                                    <- no news: top story of the feed
+
+    -> {"id": "a1", "status": "ok", "output": "output/worker/a1.mp4", "seconds": 4.12}
+"""
+import importlib
+import json
+import os
+import subprocess
+import sys
+import time
+
+import tracing
+from image_assets import get_session
+from news_scraper import get_trending_news
+from overlays import anchor_sprite, get_font, panel_layer
+from script_generator import key_points
+from stream_encoder import ffmpeg_exe
+from text_layout import BODY_SIZES
+from video_generator import create_video
+
+WORKER_DIR = os.path.join("output", "worker")
+
+# third-party modules a render loads, in the order it touches them (moviepy only for engine="moviepy")
+HEAVY_MODULES = ("numpy", "PIL.Image", "requests", "feedparser", "imageio_ffmpeg", "moviepy.editor")
+
+# (size, bold) of every font the slide renderer asks for: title, source tag and speech bubble
+# (video_generator / overlays), then every body size layout_bullets may pick
+WARM_FONTS = ((60, True), (30, True), (26, True)) + tuple((size, False) for size in BODY_SIZES)
+
+_IMPORT_TIMER = """
+import importlib, json, sys, time
+timings = {}
+for name in sys.argv[1:]:
+    started = time.perf_counter()
+    importlib.import_module(name)
+    timings[name] = time.perf_counter() - started
+print(json.dumps(timings))
+"""
+
+
+def cold_import_times(names=HEAVY_MODULES) -> dict:
+    """
+    {module: seconds} to import each module in a fresh interpreter, in order (shared
+    dependencies are charged to the first module that pulls them in). This is the cost
+    every one-shot invocation pays and a warm worker pays once.
+    """
+    proc = subprocess.run([sys.executable, "-c", _IMPORT_TIMER, *names], capture_output=True, text=True, check=True)
+    return json.loads(proc.stdout)
+
+
+def warm(engine: str = "stream") -> dict:
+    """
+    Load everything a render needs up front; returns {step: seconds}.
+    """
+    steps = {
+        "ffmpeg_probe": ffmpeg_exe,
+        "fonts": lambda: [get_font(size, bold) for size, bold in WARM_FONTS],
+        "overlays": lambda: (panel_layer(), anchor_sprite()),
+        "http_session": get_session,
+    }
+    if engine == "moviepy":
+        steps["moviepy"] = lambda: importlib.import_module("moviepy.editor")
+    timings = {}
+    for name, step in steps.items():
+        started = time.perf_counter()
+        step()
+        timings[name] = time.perf_counter() - started
+    return timings
+
+
+def print_timings(title: str, timings: dict, out=sys.stdout):
+    print(f"⏱️ {title}: {sum(timings.values()):.2f}s", file=out)
+    for name, seconds in sorted(timings.items(), key=lambda kv: -kv[1]):
+        print(f"   {name:16} {seconds * 1000:8.1f} ms", file=out)
+
+
+def run_job(job: dict, out_dir: str = WORKER_DIR, **render_opts) -> dict:
+    """
+    Render one job (see module docstring). job["options"] override render_opts for that job only.
+    """
+    started = time.time()
+    job_id = str(job.get("id") or int(started * 1000))
+    result = {"id": job_id}
+    try:
+        with tracing.span("job", id=job_id):
+            news = job.get("news") or get_trending_news()
+            # a client-written script is split into points as before; otherwise summarize the news
+            script = job.get("script")
+            points = None if script else key_points([news])[0]
+            out_path = job.get("out_path") or os.path.join(out_dir, f"{job_id}.mp4")
+            opts = {**render_opts, **(job.get("options") or {})}
+            result["output"] = create_video(script_text=script, news=news, out_path=out_path, points=points,
+                                            **opts)
+        result["status"] = "ok"
+    except Exception as e:
+        result["status"] = "error"
+        result["error"] = str(e)
+    result["seconds"] = round(time.time() - started, 2)
+    return result
+
+
+def run_worker(infile=None, out_dir: str = WORKER_DIR, **render_opts) -> dict:
+    """
+    Warm up, then serve JSON-line jobs from infile (default stdin) until EOF.
+    Results go to stdout as JSON lines, progress to stderr. Returns {"jobs", "ok", "errors"}.
+    """
+    print_timings("Warm-up", warm(render_opts.get("engine", "stream")), out=sys.stderr)
+
+    stats = {"jobs": 0, "ok": 0, "errors": 0}
+    stream = open(infile, encoding="utf-8") if infile else sys.stdin
+    try:
+        for line in stream:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                job = json.loads(line)
+                if not isinstance(job, dict):
+                    raise ValueError(f"expected a JSON object, got {type(job).__name__}")
+            except ValueError as e:
+                result = {"id": None, "status": "error", "error": f"bad job line: {e}"}
+            else:
+                result = run_job(job, out_dir=out_dir, **render_opts)
+            stats["jobs"] += 1
+            stats["ok" if result["status"] == "ok" else "errors"] += 1
+            sys.stdout.write(json.dumps(result, ensure_ascii=False) + "\n")
+            sys.stdout.flush()
+            mark = "✅" if result["status"] == "ok" else "❌"
+            print(f"{mark} job {result['id']} ({result.get('seconds', 0)}s)", file=sys.stderr)
+    finally:
+        if infile:
+            stream.close()
+    return stats
@@ -1,35 +1,59 @@
-import json
+import argparse
 import os
 from scraper import scrape_trending_products
-from seo_keywords import pick_main_keywords
-from blog_generator import generate_blog
+from pipeline import write_blog
+from product_store import ProductStore
 
-def run():
+def run(force=False):
     os.makedirs("output", exist_ok=True)
 
     products = scrape_trending_products(limit=5)
-    with open("output/products.json", "w", encoding="utf-8") as f:
-        json.dump(products, f, indent=2, ensure_ascii=False)
-
-    # pick 1 product (top trending)
-    product = products[0]
-    keywords = pick_main_keywords(product["title"])
-
-    title, blog = generate_blog(product, keywords)
-
-    md = f"""# {title}
-
-**Main SEO keywords:** {", ".join(keywords)}
-
-{blog}
-"""
-    with open("output/blog.md", "w", encoding="utf-8") as f:
-        f.write(md)
-
-    print("✅ Products scraped:", len(products))
+    store = ProductStore()
+    try:
+        store.upsert_many(products)
+
+        # pick 1 product (top trending); its blog is only rebuilt if the product changed
+        product = products[0]
+        record = write_blog(product, "output/blog.md", store=store, force=force)
+    finally:
+        store.close()
+    if record["status"] == "error":
+        raise RuntimeError(record["error"])
+
+    print("✅ Products scraped:", len(products), "(saved to output/products.sqlite3)")
     print("✅ Chosen product:", product["title"])
-    print("✅ Keywords:", keywords)
-    print("✅ Blog saved to: output/blog.md")
+    print("✅ Keywords:", record["keywords"])
+    if record["status"] == "skipped":
+        print("✅ Product unchanged, kept existing blog: output/blog.md")
+    else:
+        print("✅ Blog saved to: output/blog.md")
+
+def run_bulk_mode(workers=8, concurrency=8, max_pages=None, force=False):
+    from crawler import iter_products
+    from pipeline import run_bulk
+
+    print("✅ Starting bulk blog generation for the whole catalogue...")
+    store = ProductStore()
+    try:
+        index_path = run_bulk(iter_products(concurrency=concurrency, max_pages=max_pages), workers=workers,
+                              store=store, force=force)
+        print("✅ Products in store:", store.count())
+    finally:
+        store.close()
+    print("✅ Index saved to:", index_path)
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description="SEO blog generator")
+    parser.add_argument("--bulk", action="store_true", help="crawl the whole catalogue and write a blog per product")
+    parser.add_argument("--workers", type=int, default=8, help="keyword/blog worker threads (bulk mode)")
+    parser.add_argument("--concurrency", type=int, default=8, help="parallel HTTP requests while crawling")
+    parser.add_argument("--max-pages", type=int, default=None, help="only crawl the first N catalogue pages")
+    parser.add_argument("--force", action="store_true", help="regenerate blogs even for unchanged products")
+    return parser.parse_args()
 
 if __name__ == "__main__":
-    run()
+    args = _parse_args()
+    if args.bulk:
+        run_bulk_mode(workers=args.workers, concurrency=args.concurrency, max_pages=args.max_pages, force=args.force)
+    else:
+        run(force=args.force)
@@ -0,0 +1,76 @@
+import argparse
+import glob
+import os
+import time
+from urllib.parse import urljoin
+
+import requests
+
+from scraper import BASE, parse_listing
+
+PAGES_DIR = os.path.join("output", "pages")
+
+
+def download_pages(n: int, base_url: str = BASE, pages_dir: str = PAGES_DIR) -> list[str]:
+    """
+    Save the home page and catalogue pages 1..n as raw bytes, so runs are repeatable offline.
+    """
+    os.makedirs(pages_dir, exist_ok=True)
+    urls = [base_url] + [urljoin(base_url, f"catalogue/page-{i}.html") for i in range(1, n + 1)]
+    paths = []
+    with requests.Session() as session:
+        for i, url in enumerate(urls):
+            r = session.get(url, timeout=15)
+            r.raise_for_status()
+            path = os.path.join(pages_dir, f"{i:03d}.html")
+            with open(path, "wb") as f:
+                f.write(r.content)
+            paths.append(path)
+    return paths
+
+
+def bench(paths: list[str], repeat: int = 20, page_url: str = BASE) -> dict:
+    """
+    Mean ms per page for the soup and fast parsers; also checks that both give the same products.
+    """
+    pages = []
+    for path in paths:
+        with open(path, "rb") as f:
+            pages.append(f.read())
+
+    for html in pages:
+        if parse_listing(html, page_url, fast=True) != parse_listing(html, page_url, fast=False):
+            raise AssertionError("fast and soup parsers disagree on a saved page")
+
+    timings = {}
+    for name, fast in (("soup", False), ("fast", True)):
+        started = time.perf_counter()
+        for _ in range(repeat):
+            for html in pages:
+                parse_listing(html, page_url, fast=fast)
+        timings[name] = (time.perf_counter() - started) * 1000 / (repeat * len(pages))
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Listing-page parser micro-benchmark")
+    parser.add_argument("--pages-dir", default=PAGES_DIR, help="directory of saved listing pages (*.html)")
+    parser.add_argument("--download", type=int, default=0, help="first save N catalogue pages from --base")
+    parser.add_argument("--base", default=BASE)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    if args.download:
+        download_pages(args.download, args.base, args.pages_dir)
+    paths = sorted(glob.glob(os.path.join(args.pages_dir, "*.html")))
+    if not paths:
+        parser.error(f"no saved pages in {args.pages_dir} (run with --download N first)")
+
+    t = bench(paths, args.repeat, args.base)
+    print(f"✅ {len(paths)} pages x {args.repeat} runs")
+    print(f"soup: {t['soup']:.2f} ms/page")
+    print(f"fast: {t['fast']:.2f} ms/page  ({t['soup'] / t['fast']:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
@@ -18,3 +18,11 @@ Final tip: shortlist 2–3 similar titles, compare reviews, and pick the one tha
         body = " ".join(words[:200]) + "..."
 
     return title, body
+
+def to_markdown(title, keywords, blog):
+    return f"""# {title}
+
+**Main SEO keywords:** {", ".join(keywords)}
+
+{blog}
+"""
@@ -0,0 +1,185 @@
+import asyncio
+import queue
+import random
+import re
+import threading
+from urllib.parse import urljoin
+
+import aiohttp
+from bs4 import BeautifulSoup
+
+from scraper import parse_listing
+
+BASE = "https://books.toscrape.com/"
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class FetchError(Exception):
+    pass
+
+
+class _RetryableStatus(FetchError):
+    pass
+
+
+class ParseError(ValueError):
+    pass
+
+
+async def _fetch(session: aiohttp.ClientSession, sem: asyncio.Semaphore, url: str,
+                 retries: int = 3, backoff: float = 0.5) -> str:
+    """
+    GET url as text with bounded concurrency and exponential backoff on network errors / 429 / 5xx.
+    Pages are decoded as UTF-8 explicitly (the site sends no charset, which is what turned
+    "£" into "Â£" with requests' ISO-8859-1 guess).
+    """
+    for attempt in range(retries + 1):
+        try:
+            async with sem:
+                async with session.get(url) as resp:
+                    if resp.status in RETRY_STATUSES:
+                        raise _RetryableStatus(f"HTTP {resp.status}")
+                    if resp.status >= 400:
+                        raise FetchError(f"{url}: HTTP {resp.status}")
+                    return (await resp.read()).decode("utf-8", errors="replace")
+        except (aiohttp.ClientError, asyncio.TimeoutError, _RetryableStatus) as e:
+            if attempt == retries:
+                raise FetchError(f"{url}: {e!r}") from e
+            await asyncio.sleep(backoff * (2 ** attempt) * (1 + random.random() / 2))
+
+
+def _parse_listing(html: str, page_url: str) -> tuple:
+    """
+    Catalogue page -> (absolute product detail URLs, total page count or None).
+    """
+    products, pages = parse_listing(html, page_url)
+    return [p["url"] for p in products], pages
+
+
+def _parse_detail(html: str, url: str) -> dict:
+    """
+    Product detail page -> product dict; ParseError if it has no title or price (not a product page).
+    """
+    soup = BeautifulSoup(html, "lxml")
+    main = soup.select_one("div.product_main")
+    price_tag = main.select_one(".price_color") if main else None
+    if not (main and main.h1 and price_tag):
+        raise ParseError(f"{url}: no product title or price")
+    table = {th.get_text(strip=True): td.get_text(strip=True)
+             for th, td in ((tr.th, tr.td) for tr in soup.select("table.table tr")) if th and td}
+
+    rating_tag = main.select_one("p.star-rating")
+    rating = next((c for c in rating_tag.get("class", []) if c != "star-rating"), "") if rating_tag else ""
+    availability = table.get("Availability", "")
+    stock = re.search(r"(\d+)\s+available", availability)
+    desc_anchor = soup.select_one("#product_description")
+    desc_tag = desc_anchor.find_next_sibling("p") if desc_anchor else None
+
+    return {
+        "title": main.h1.get_text(strip=True),
+        "price": price_tag.get_text(strip=True),
+        "rating": rating,
+        "url": url,
+        "upc": table.get("UPC", ""),
+        "availability": availability,
+        "stock": int(stock.group(1)) if stock else 0,
+        "description": desc_tag.get_text(strip=True) if desc_tag else "",
+    }
+
+
+async def crawl_products(base_url: str = BASE, concurrency: int = 8, retries: int = 3, backoff: float = 0.5,
+                         max_pages: int = None, timeout: float = 15):
+    """
+    Async generator over every product in the catalogue, with UPC, stock and description
+    from the detail pages. Products are yielded as soon as their detail page arrives
+    (not in catalogue order). Point base_url at a local server to crawl saved HTML.
+    """
+    first_page = urljoin(base_url, "catalogue/page-1.html")
+    sem = asyncio.Semaphore(concurrency)
+    connector = aiohttp.TCPConnector(limit=concurrency)
+
+    async with aiohttp.ClientSession(connector=connector, timeout=aiohttp.ClientTimeout(total=timeout),
+                                     headers={"User-Agent": "Mozilla/5.0"}) as session:
+        html = await _fetch(session, sem, first_page, retries, backoff)
+        links, pages = _parse_listing(html, first_page)
+        pages = min(pages or 1, max_pages or pages or 1)
+
+        # One bad page should not end a full-catalogue crawl: report it and carry on
+        async def listing(n):
+            url = urljoin(base_url, f"catalogue/page-{n}.html")
+            try:
+                return _parse_listing(await _fetch(session, sem, url, retries, backoff), url)[0]
+            except FetchError as e:
+                print("⚠️ Skipping catalogue page:", e)
+                return []
+
+        async def detail(url):
+            try:
+                return _parse_detail(await _fetch(session, sem, url, retries, backoff), url)
+            except (FetchError, ParseError) as e:
+                print("⚠️ Skipping product:", e)
+                return None
+
+        seen = set()
+        pending = set()
+
+        def schedule(urls):
+            for u in urls:
+                if u not in seen:
+                    seen.add(u)
+                    pending.add(asyncio.create_task(detail(u)))
+
+        schedule(links)
+        listing_tasks = {asyncio.create_task(listing(n)) for n in range(2, pages + 1)}
+        pending |= listing_tasks
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task in listing_tasks:
+                        schedule(task.result())
+                    elif task.result() is not None:
+                        yield task.result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+
+def iter_products(queue_size: int = 64, **kwargs):
+    """
+    Blocking iterator over crawl_products for thread-based callers. The crawl runs on its own
+    event loop in a background thread; the bounded queue pauses it when the consumer falls behind.
+    """
+    q = queue.Queue(maxsize=queue_size)
+    done = object()
+
+    def run():
+        async def pump():
+            loop = asyncio.get_running_loop()
+            async for p in crawl_products(**kwargs):
+                await loop.run_in_executor(None, q.put, p)
+        try:
+            asyncio.run(pump())
+        except BaseException as e:
+            q.put(e)
+        q.put(done)
+
+    threading.Thread(target=run, name="catalogue-crawler", daemon=True).start()
+    while True:
+        item = q.get()
+        if item is done:
+            return
+        if isinstance(item, BaseException):
+            raise item
+        yield item
+
+
+def crawl_all(**kwargs) -> list[dict]:
+    """
+    Blocking helper: the whole catalogue as a list (see crawl_products for options).
+    """
+    async def collect():
+        return [p async for p in crawl_products(**kwargs)]
+    return asyncio.run(collect())
@@ -0,0 +1,108 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+SUGGEST_CACHE_PATH = os.path.join("output", "suggest_cache.sqlite3")
+SUGGEST_TTL_SEC = 7 * 24 * 3600
+
+
+def _normalize(query: str) -> str:
+    return " ".join((query or "").lower().split())
+
+
+class SuggestCache:
+    """
+    On-disk TTL cache of autocomplete suggestions (SQLite, safe to share between threads).
+    """
+
+    def __init__(self, path: str = SUGGEST_CACHE_PATH, ttl: float = SUGGEST_TTL_SEC):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(
+            "CREATE TABLE IF NOT EXISTS suggestions (key TEXT PRIMARY KEY, value TEXT NOT NULL, fetched_at REAL)"
+        )
+
+    def get(self, key: str):
+        with self._lock:
+            row = self.conn.execute("SELECT value, fetched_at FROM suggestions WHERE key = ?", (key,)).fetchone()
+        if row is None or time.time() - row[1] > self.ttl:
+            return None
+        return json.loads(row[0])
+
+    def put(self, key: str, value: list):
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO suggestions (key, value, fetched_at) VALUES (?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), time.time()),
+            )
+
+    def close(self):
+        self.conn.close()
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: at most `rate` calls per second on average, bursts up to `capacity`.
+    """
+
+    def __init__(self, rate: float = 5.0, capacity: int = 5):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class SuggestClient:
+    """
+    Cached, rate-limited, concurrent front end for an autocomplete fetcher
+    (`fetch(query, limit) -> list[str]`, e.g. seo_keywords.google_suggest).
+    """
+
+    def __init__(self, fetch, cache: SuggestCache = None, bucket: TokenBucket = None, workers: int = 8):
+        self.fetch = fetch
+        self.cache = cache if cache is not None else SuggestCache()
+        self.bucket = bucket if bucket is not None else TokenBucket()
+        self.workers = workers
+
+    def suggest(self, query: str, limit: int = 8) -> list[str]:
+        key = f"{limit}|{_normalize(query)}"
+        cached = self.cache.get(key)
+        if cached is not None:
+            return cached
+        self.bucket.acquire()
+        try:
+            value = self.fetch(query, limit=limit)
+        except Exception as e:
+            # a throttled or failed lookup is not cached, so the next run tries again
+            print(f"⚠️ Suggest lookup failed for {query!r}: {e}")
+            return []
+        self.cache.put(key, value)
+        return value
+
+    def suggest_many(self, queries: list[str], limit: int = 8) -> dict:
+        """
+        {query: suggestions} for many queries; cache misses are fetched concurrently.
+        """
+        unique = list(dict.fromkeys(queries))
+        if not unique:
+            return {}
+        with ThreadPoolExecutor(max_workers=min(self.workers, len(unique))) as pool:
+            return dict(zip(unique, pool.map(lambda q: self.suggest(q, limit), unique)))
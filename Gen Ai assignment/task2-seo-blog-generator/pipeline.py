@@ -0,0 +1,180 @@
+import json
+import os
+import queue
+import re
+import threading
+import time
+
+from blog_generator import generate_blog, to_markdown
+from keyword_scoring import KeywordScorer
+from product_store import content_hash
+from seo_keywords import pick_main_keywords, pick_main_keywords_batch
+
+BLOGS_DIR = os.path.join("output", "blogs")
+
+_DONE = object()
+
+
+def product_slug(product: dict) -> str:
+    """
+    Stable file name for a product: the catalogue path segment ("a-light-in-the-attic_1000"),
+    falling back to the slugified title.
+    """
+    parts = [p for p in (product.get("url") or "").split("/") if p and p != "index.html"]
+    base = parts[-1] if len(parts) > 2 else product.get("title", "")
+    slug = re.sub(r"[^a-z0-9_]+", "-", base.lower()).strip("-")
+    return slug[:80] or "product"
+
+
+def _unchanged(product: dict, path: str, previous, digest: str) -> bool:
+    return bool(previous and previous["content_hash"] == digest and previous["path"] == path
+                and os.path.exists(path))
+
+
+def needs_blog(product: dict, path: str, store=None, force: bool = False) -> bool:
+    """
+    False if write_blog would skip this product as unchanged.
+    """
+    if force or store is None:
+        return True
+    return not _unchanged(product, path, store.get_blog(product["url"]), content_hash(product))
+
+
+def write_blog(product: dict, path: str, store=None, force: bool = False, keywords: list = None) -> dict:
+    """
+    keywords -> blog -> Markdown file for one product; returns its index record.
+
+    With a product_store.ProductStore, the product's content hash is compared with the one the
+    existing blog was written from: unchanged products (whose file is still there) are skipped
+    with status "skipped", otherwise the status is "new" or "updated".
+    keywords, if already picked (run_bulk batches them), are used instead of fetching them here.
+    """
+    record = {"title": product.get("title", ""), "url": product.get("url", ""),
+              "price": product.get("price", ""), "rating": product.get("rating", "")}
+    try:
+        digest = content_hash(product)
+        previous = store.get_blog(product["url"]) if store is not None else None
+        record["content_hash"] = digest
+        if not force and _unchanged(product, path, previous, digest):
+            record.update({"status": "skipped", "keywords": previous["keywords"],
+                           "blog_title": previous["blog_title"], "path": path})
+            return record
+
+        if keywords is None:
+            keywords = pick_main_keywords(product["title"])
+        title, blog = generate_blog(product, keywords)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(to_markdown(title, keywords, blog))
+        if store is not None:
+            store.save_blog(product["url"], digest, keywords, title, path)
+        record.update({"status": "updated" if previous else "new", "keywords": keywords,
+                       "blog_title": title, "path": path})
+    except Exception as e:
+        record.update({"status": "error", "error": str(e)})
+    return record
+
+
+def run_bulk(products, out_dir: str = BLOGS_DIR, workers: int = 8, queue_size: int = 64, store=None,
+             force: bool = False, batch_size: int = 16) -> str:
+    """
+    Streaming scrape -> keywords -> blog pipeline over any product iterable (e.g. crawler.iter_products()).
+
+    A pool of worker threads handles the I/O-bound stages. Each worker takes up to batch_size
+    queued products and fetches the keywords of the changed ones in one suggestion fan-out,
+    ranked by a single catalogue-wide KeywordScorer. Its title statistics are fixed before any
+    ranking starts (the store's catalogue, plus the products themselves when they are a list),
+    so the keywords do not depend on crawl or thread timing. Each finished product is written
+    to its own Markdown file and appended to this run's index.jsonl right away, so a crash
+    keeps everything done so far.
+    Queues are bounded, so memory does not grow with the catalogue.
+    If a product_store.ProductStore is given, every product is upserted into it and only new or
+    changed products are regenerated (see write_blog; force=True rebuilds everything). The
+    new / updated / skipped / failed URLs are written to report.json next to the index.
+    Returns the index path.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    index_path = os.path.join(out_dir, "index.jsonl")
+
+    todo = queue.Queue(maxsize=queue_size)
+    results = queue.Queue(maxsize=queue_size)
+    feed_error = []
+    catalogue = store.titles() if store is not None else []
+    if isinstance(products, (list, tuple)):
+        catalogue += [p.get("title", "") for p in products]
+    scorer = KeywordScorer(catalogue)
+
+    def feed():
+        try:
+            for product in products:
+                todo.put(product)
+        except Exception as e:
+            feed_error.append(e)
+        finally:
+            for _ in range(workers):
+                todo.put(_DONE)
+
+    def next_batch() -> tuple:
+        """
+        (up to batch_size products, whether the feed is finished for this worker).
+        """
+        batch = []
+        item = todo.get()
+        while item is not _DONE:
+            batch.append(item)
+            if len(batch) >= batch_size:
+                return batch, False
+            try:
+                item = todo.get_nowait()
+            except queue.Empty:
+                return batch, False
+        return batch, True
+
+    def work():
+        done = False
+        while not done:
+            batch, done = next_batch()
+            jobs = [(p, os.path.join(out_dir, f"{product_slug(p)}.md")) for p in batch]
+            stale = [p.get("title", "") for p, path in jobs if needs_blog(p, path, store, force)]
+            titles = list(dict.fromkeys(stale))
+            try:
+                keywords = pick_main_keywords_batch(titles, scorer=scorer) if titles else {}
+            except Exception:
+                keywords = {}  # write_blog retries per product and records the error there
+            for product, path in jobs:
+                record = write_blog(product, path, store, force, keywords.get(product.get("title", "")))
+                results.put((product, record))
+        results.put(_DONE)
+
+    threading.Thread(target=feed, name="bulk-feed", daemon=True).start()
+    for i in range(workers):
+        threading.Thread(target=work, name=f"bulk-worker-{i}", daemon=True).start()
+
+    started, finished = time.time(), 0
+    report = {"new": [], "updated": [], "skipped": [], "error": []}
+    # index.jsonl describes this run (like report.json); the store keeps the history
+    with open(index_path, "w", encoding="utf-8") as index:
+        while finished < workers:
+            item = results.get()
+            if item is _DONE:
+                finished += 1
+                continue
+            product, record = item
+            if store is not None:
+                store.upsert(product)
+            index.write(json.dumps(record, ensure_ascii=False) + "\n")
+            index.flush()
+            report[record["status"]].append(record["url"])
+            if record["status"] == "error":
+                print(f"❌ {record['title'][:60]}: {record['error']}")
+            done = sum(len(v) for v in report.values())
+            if done % 50 == 0:
+                print(f"✅ {done} products processed ({time.time() - started:.0f}s)")
+
+    with open(os.path.join(out_dir, "report.json"), "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    if feed_error:
+        print("⚠️ Product source stopped early:", feed_error[0])
+    print(f"✅ Bulk run done: {len(report['new'])} new, {len(report['updated'])} updated, "
+          f"{len(report['skipped'])} unchanged (skipped), {len(report['error'])} failed")
+    return index_path
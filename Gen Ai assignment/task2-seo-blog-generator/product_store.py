@@ -0,0 +1,240 @@
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from decimal import Decimal, InvalidOperation
+
+PRODUCT_DB_PATH = os.path.join("output", "products.sqlite3")
+
+RATINGS = {"zero": 0, "one": 1, "two": 2, "three": 3, "four": 4, "five": 5}
+
+# price is kept in integer pence so SQLite sorts and filters it exactly
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS products (
+    url           TEXT PRIMARY KEY,
+    title         TEXT NOT NULL,
+    price_pence   INTEGER,
+    currency      TEXT,
+    rating        INTEGER,
+    upc           TEXT,
+    availability  TEXT,
+    stock         INTEGER,
+    description   TEXT,
+    updated_at    REAL,
+    detailed      INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_products_rating_price ON products (rating, price_pence);
+CREATE INDEX IF NOT EXISTS idx_products_price ON products (price_pence);
+CREATE TABLE IF NOT EXISTS blogs (
+    url           TEXT PRIMARY KEY,
+    content_hash  TEXT NOT NULL,
+    keywords      TEXT,
+    blog_title    TEXT,
+    path          TEXT,
+    generated_at  REAL
+);
+"""
+
+COLUMNS = "url, title, price_pence, currency, rating, upc, availability, stock, description, updated_at"
+
+# only a product detail page has these; a listing row leaves them unknown (None), never empty / 0
+DETAIL_FIELDS = ("upc", "stock", "description")
+
+_PRICE = re.compile(r"(\d+(?:[.,]\d+)?)")
+
+
+def parse_price(text) -> tuple:
+    """
+    "£51.77" -> (Decimal("51.77"), "£"). Also copes with old mojibake ("Â£51.77"). (None, "") if no number.
+    """
+    if isinstance(text, Decimal):
+        return text, ""
+    text = (text or "").replace("Â", "").strip()
+    m = _PRICE.search(text)
+    if not m:
+        return None, ""
+    try:
+        value = Decimal(m.group(1).replace(",", "."))
+    except InvalidOperation:
+        return None, ""
+    return value, text[:m.start()].strip()
+
+
+def parse_rating(value) -> int:
+    """
+    star-rating class ("Three", or the full ["star-rating", "Three"] list) / number -> 0..5.
+    """
+    if isinstance(value, int):
+        return value
+    if isinstance(value, (list, tuple)):
+        value = next((c for c in value if c != "star-rating"), "")
+    value = str(value or "").strip().lower()
+    return int(value) if value.isdigit() else RATINGS.get(value, 0)
+
+
+def in_stock(availability) -> bool:
+    """
+    "In stock (22 available)" / "In stock" -> True, "Out of stock" / "" -> False.
+    """
+    text = " ".join(str(availability or "").lower().split())
+    return text.startswith("in stock")
+
+
+def content_hash(product: dict) -> str:
+    """
+    Hash of the fields a blog is written from (title, price, rating, in stock or not), normalized so
+    "£51.77" / "Â£51.77", "Three" / 3 or a changed stock count do not count as changes.
+    """
+    price, _ = parse_price(product.get("price"))
+    key = [
+        " ".join((product.get("title") or "").split()),
+        str(price) if price is not None else "",
+        parse_rating(product.get("rating")),
+        in_stock(product.get("availability")),
+    ]
+    return hashlib.sha1(json.dumps(key, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+
+def _row_to_product(row) -> dict:
+    url, title, pence, currency, rating, upc, availability, stock, description, updated_at = row
+    return {
+        "url": url,
+        "title": title,
+        "price": Decimal(pence).scaleb(-2) if pence is not None else None,
+        "currency": currency or "",
+        "rating": rating,
+        "upc": upc or "",
+        "availability": availability or "",
+        "stock": stock,
+        "description": description or "",
+        "updated_at": updated_at,
+    }
+
+
+class ProductStore:
+    """
+    Indexed local catalogue (SQLite, keyed by product URL) with typed price and rating columns.
+    Safe to share between threads.
+    """
+
+    def __init__(self, path: str = PRODUCT_DB_PATH):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.executescript(SCHEMA)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(products)")}
+        if "detailed" not in columns:  # stores created before the column existed
+            with self.conn:
+                self.conn.execute("ALTER TABLE products ADD COLUMN detailed INTEGER NOT NULL DEFAULT 0")
+                self.conn.execute("UPDATE products SET detailed = 1 WHERE upc <> ''")
+
+    def close(self):
+        self.conn.close()
+
+    @staticmethod
+    def _row(product: dict) -> tuple:
+        price, currency = parse_price(product.get("price"))
+        return (
+            product["url"],
+            product.get("title", ""),
+            int((price * 100).to_integral_value()) if price is not None else None,
+            product.get("currency") or currency,
+            parse_rating(product.get("rating")),
+            product.get("upc"),
+            product.get("availability") or None,
+            product.get("stock"),
+            product.get("description"),
+            time.time(),
+            int(any(field in product for field in DETAIL_FIELDS)),
+        )
+
+    def upsert_many(self, products) -> int:
+        """
+        Insert or update products by URL in one transaction; returns how many were written.
+        A detail-page product (one with any of DETAIL_FIELDS) always wins, so stock can drop to 0;
+        a listing row refreshes title / price / rating but leaves detail-page availability, stock,
+        UPC and description alone.
+        """
+        rows = [self._row(p) for p in products]
+        detail_wins = "excluded.detailed OR NOT products.detailed"
+        keep = ", ".join(f"{col} = CASE WHEN {detail_wins} THEN excluded.{col} ELSE products.{col} END"
+                         for col in ("upc", "availability", "stock", "description"))
+        with self._lock, self.conn:
+            self.conn.executemany(
+                f"INSERT INTO products ({COLUMNS}, detailed) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(url) DO UPDATE SET title = excluded.title, price_pence = excluded.price_pence, "
+                f"currency = excluded.currency, rating = excluded.rating, {keep}, "
+                "updated_at = excluded.updated_at, detailed = MAX(excluded.detailed, products.detailed)",
+                rows,
+            )
+        return len(rows)
+
+    def upsert(self, product: dict):
+        self.upsert_many([product])
+
+    def get(self, url: str):
+        with self._lock:
+            row = self.conn.execute(f"SELECT {COLUMNS} FROM products WHERE url = ?", (url,)).fetchone()
+        return _row_to_product(row) if row else None
+
+    def titles(self) -> list[str]:
+        with self._lock:
+            return [row[0] for row in self.conn.execute("SELECT title FROM products")]
+
+    def count(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM products").fetchone()[0]
+
+    def query(self, min_rating: int = None, max_price=None, order: str = "rating", limit: int = None) -> list[dict]:
+        """
+        Filtered catalogue slice. order: "rating" (best first, then cheapest) or "price" (cheapest first).
+        """
+        where, params = [], []
+        if min_rating is not None:
+            where.append("rating >= ?")
+            params.append(int(min_rating))
+        if max_price is not None:
+            where.append("price_pence <= ?")
+            params.append(int((Decimal(str(max_price)) * 100).to_integral_value()))
+        sql = f"SELECT {COLUMNS} FROM products"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY price_pence ASC, url" if order == "price" else " ORDER BY rating DESC, price_pence ASC, url"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        with self._lock:
+            rows = self.conn.execute(sql, params).fetchall()
+        return [_row_to_product(r) for r in rows]
+
+    def top_rated(self, max_price=20, limit: int = 10) -> list[dict]:
+        """
+        Best-rated products at or under max_price (e.g. "top-rated under £20").
+        """
+        return self.query(max_price=max_price, order="rating", limit=limit)
+
+    def get_blog(self, url: str):
+        """
+        The last generated blog for a product: {"content_hash", "keywords", "blog_title", "path", "generated_at"}.
+        """
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT content_hash, keywords, blog_title, path, generated_at FROM blogs WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {"content_hash": row[0], "keywords": json.loads(row[1] or "[]"), "blog_title": row[2],
+                "path": row[3], "generated_at": row[4]}
+
+    def save_blog(self, url: str, content_hash: str, keywords: list, blog_title: str, path: str):
+        with self._lock, self.conn:
+            self.conn.execute(
+                "INSERT INTO blogs (url, content_hash, keywords, blog_title, path, generated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(url) DO UPDATE SET content_hash = excluded.content_hash, keywords = excluded.keywords, "
+                "blog_title = excluded.blog_title, path = excluded.path, generated_at = excluded.generated_at",
+                (url, content_hash, json.dumps(keywords, ensure_ascii=False), blog_title, path, time.time()),
+            )
@@ -1,25 +1,98 @@
+import io
+import re
+from urllib.parse import urljoin
+
 import requests
 from bs4 import BeautifulSoup
+from lxml import etree
 
 BASE = "https://books.toscrape.com/"
 
-def scrape_trending_products(limit: int = 5):
-    html = requests.get(BASE, timeout=15).text
+_PAGER = re.compile(r"of\s+(\d+)")
+
+
+def _text(el) -> str:
+    return " ".join("".join(el.itertext()).split())
+
+
+def _parse_listing_fast(html, page_url: str, limit: int = None) -> tuple:
+    """
+    Event-parser path: lxml's iterparse only hands us finished <article>/<li> elements,
+    every field of a product is read in a single walk over its own subtree, and the
+    subtree is dropped right after, so no document-wide tree or CSS queries are needed.
+    """
+    if isinstance(html, str):
+        html = html.encode("utf-8")
+    items, pages = [], None
+    events = etree.iterparse(io.BytesIO(html), events=("end",), tag=("article", "li"), html=True,
+                             encoding="utf-8", recover=True)
+    for _, el in events:
+        classes = (el.get("class") or "").split()
+        if el.tag == "li":
+            if "current" in classes:
+                m = _PAGER.search(_text(el))
+                pages = int(m.group(1)) if m else None
+            continue
+        if "product_pod" not in classes or (limit is not None and len(items) >= limit):
+            continue
+
+        item = {"title": "", "price": "", "rating": "", "availability": "", "url": ""}
+        for tag in el.iter("a", "p"):
+            tag_classes = (tag.get("class") or "").split()
+            if tag.tag == "a":
+                if tag.getparent().tag == "h3":
+                    item["title"] = (tag.get("title") or "").strip()
+                    item["url"] = urljoin(page_url, tag.get("href", ""))
+            elif "price_color" in tag_classes:
+                item["price"] = _text(tag)
+            elif "star-rating" in tag_classes:
+                item["rating"] = next((c for c in tag_classes if c != "star-rating"), "")
+            elif "availability" in tag_classes:
+                item["availability"] = _text(tag)
+        items.append(item)
+        el.clear()
+    return items, pages
+
+
+def _parse_listing_soup(html, page_url: str, limit: int = None) -> tuple:
+    """
+    Original path: full BeautifulSoup tree + CSS selects per product (kept for comparison).
+    """
+    if isinstance(html, bytes):
+        html = html.decode("utf-8", errors="replace")
     soup = BeautifulSoup(html, "lxml")
 
     items = []
     for a in soup.select("article.product_pod")[:limit]:
-        title = a.h3.a.get("title", "").strip()
-        price = a.select_one(".price_color").get_text(strip=True)
-        rating = a.select_one("p.star-rating")["class"][1]  # One, Two, Three...
-        link = a.h3.a.get("href", "")
-        product_url = BASE + link.replace("../", "")
-
         items.append({
-            "title": title,
-            "price": price,
-            "rating": rating,
-            "url": product_url
+            "title": a.h3.a.get("title", "").strip(),
+            "price": a.select_one(".price_color").get_text(strip=True),
+            "rating": a.select_one("p.star-rating")["class"][1],  # One, Two, Three...
+            "availability": a.select_one("p.availability").get_text(strip=True),
+            "url": urljoin(page_url, a.h3.a.get("href", "")),
         })
 
+    pages = None
+    current = soup.select_one("li.current")
+    if current:
+        m = _PAGER.search(current.get_text())
+        pages = int(m.group(1)) if m else None
+    return items, pages
+
+
+def parse_listing(html, page_url: str = BASE, limit: int = None, fast: bool = True) -> tuple:
+    """
+    Listing page (str, or raw UTF-8 bytes) -> (products, total page count or None).
+    Product URLs are resolved against page_url.
+    """
+    parse = _parse_listing_fast if fast else _parse_listing_soup
+    return parse(html, page_url, limit)
+
+
+def scrape_trending_products(limit: int = 5, fast: bool = True):
+    r = requests.get(BASE, timeout=15)
+    r.raise_for_status()
+    # the site sends no charset, so .text would guess ISO-8859-1 and turn "£" into "Â£";
+    # the raw bytes are parsed as UTF-8 instead
+    items, _ = parse_listing(r.content, BASE, limit=limit, fast=fast)
     return items
@@ -1,42 +1,54 @@
 import requests
 
+from keyword_scoring import KeywordScorer, dedupe
+from keyword_suggest import SuggestClient
+
+_session = requests.Session()
+_client = None
+
 def google_suggest(query: str, limit: int = 8):
     url = "https://suggestqueries.google.com/complete/search"
     params = {"client": "firefox", "q": query}
-    r = requests.get(url, params=params, timeout=12)
+    r = _session.get(url, params=params, timeout=12)
     r.raise_for_status()
     data = r.json()
     suggestions = data[1] if len(data) > 1 else []
     # keep unique, short-ish
-    out = []
-    for s in suggestions:
-        s = s.strip()
-        if s and s.lower() not in [x.lower() for x in out]:
-            out.append(s)
-        if len(out) >= limit:
-            break
-    return out
-
-def pick_main_keywords(product_title: str):
+    return dedupe(suggestions)[:limit]
+
+def get_client() -> SuggestClient:
+    """
+    Process-wide suggestion client: on-disk TTL cache + rate limiter around google_suggest.
+    """
+    global _client
+    if _client is None:
+        _client = SuggestClient(google_suggest)
+    return _client
+
+def _seeds(product_title: str):
     # seed queries (simple but effective)
-    seeds = [
+    return [
         product_title,
         f"best {product_title}",
         f"{product_title} price",
         f"{product_title} review",
     ]
 
-    pool = []
-    for q in seeds:
-        pool.extend(google_suggest(q, limit=5))
+def pick_main_keywords(product_title: str, client: SuggestClient = None, scorer: KeywordScorer = None):
+    return pick_main_keywords_batch([product_title], client, scorer)[product_title]
 
-    # rank by “SEO-ish” words
-    boosters = ["best", "review", "price", "buy", "top", "cheap", "2026", "online"]
-    def score(k: str):
-        k_l = k.lower()
-        return sum(1 for b in boosters if b in k_l) + (1 if len(k) <= 45 else 0)
+def pick_main_keywords_batch(product_titles: list[str], client: SuggestClient = None,
+                             scorer: KeywordScorer = None) -> dict:
+    """
+    {title: keywords} for many products; every seed of every title goes out in one concurrent fan-out.
+    Pass a catalogue-wide scorer to rank against the whole catalogue's title statistics
+    instead of just these titles.
+    """
+    client = client or get_client()
+    found = client.suggest_many([q for t in product_titles for q in _seeds(t)], limit=5)
 
-    pool = sorted(set(pool), key=score, reverse=True)
+    pools = {t: [s for q in _seeds(t) for s in found[q]] for t in product_titles}
+    ranked = (scorer or KeywordScorer(product_titles)).rank_batch(pools)
 
     # return 3-4 keywords
-    return pool[:4] if len(pool) >= 4 else pool[:3]
+    return {t: pool[:4] if len(pool) >= 4 else pool[:3] for t, pool in ranked.items()}
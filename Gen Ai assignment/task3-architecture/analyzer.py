@@ -1,17 +1,21 @@
-from templates import TEMPLATES
+from registry import get_registry
 
-def analyze_requirement(text: str):
-    text = text.lower()
+def analyze_architecture(text: str, registry=None):
+    """
+    Immutable models.Architecture for a free-text requirement: the best-matching domain templates
+    merged together (best first in .domains), or the generic template when nothing matches.
+    The returned object is shared and cached, which is safe because it cannot be modified.
+    """
+    registry = registry or get_registry()
+    matches = registry.match(text)
 
-    if "chatbot" in text or "chat" in text:
-        return TEMPLATES["chatbot"]
+    if not matches:
+        return registry.generic()
 
-    if "ecommerce" in text or "shopping" in text:
-        return TEMPLATES["ecommerce"]
+    return registry.merge([name for name, _ in matches])
 
-    return {
-        "modules": ["Frontend", "Backend", "Database"],
-        "apis": ["POST /api"],
-        "database": ["GenericTable(id, data)"],
-        "pseudocode": ["Process request", "Return response"]
-    }
+def analyze_requirement(text: str, registry=None):
+    """
+    Same as analyze_architecture, as a fresh plain dict the caller is free to modify.
+    """
+    return analyze_architecture(text, registry).to_dict()
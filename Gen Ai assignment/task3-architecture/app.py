@@ -1,22 +1,54 @@
-import json
+import argparse
 import os
-from analyzer import analyze_requirement
+import sys
+from analyzer import analyze_architecture
+from emitters import EMITTERS, EXTENSIONS, render
 
-def run():
+def run(fmt="json"):
     requirement = input("Enter high-level business requirement: ")
 
-    architecture = analyze_requirement(requirement)
+    architecture = analyze_architecture(requirement)
 
     os.makedirs("output", exist_ok=True)
-    with open("output/architecture.json", "w") as f:
-        json.dump(architecture, f, indent=2)
+    out_path = f"output/architecture.{EXTENSIONS[fmt]}"
+    with open(out_path, "w", encoding="utf-8") as f:
+        f.write(render(architecture, fmt))
 
     print("\n✅ Generated Low-Level Architecture:\n")
-    for key, value in architecture.items():
-        print(f"{key.upper()}:")
-        for item in value:
-            print(f" - {item}")
-        print()
+    if fmt != "json":
+        print(render(architecture, fmt))
+    else:
+        for key, value in architecture.to_dict().items():
+            print(f"{key.upper()}:")
+            for item in value:
+                print(f" - {item}")
+            print()
+    print("✅ Saved to:", out_path)
+
+def run_batch_mode(path, workers=1, fmt="json"):
+    from batch import run_batch
+
+    # results go to stdout, so progress is reported on stderr
+    if path == "-":
+        stats = run_batch(sys.stdin, sys.stdout, workers=workers, fmt=fmt)
+    else:
+        with open(path, encoding="utf-8") as f:
+            stats = run_batch(f, sys.stdout, workers=workers, fmt=fmt)
+    print(f"✅ {stats['items']} requirements: {stats['analyzed']} analyzed, "
+          f"{stats['memo_hits']} from memo, {stats['errors']} errors", file=sys.stderr)
+
+def _parse_args():
+    parser = argparse.ArgumentParser(description="High-level to low-level architecture generator")
+    parser.add_argument("--batch", nargs="?", const="-", metavar="JSONL",
+                        help="read requirements as JSONL from a file (or stdin) and write JSONL to stdout")
+    parser.add_argument("--workers", type=int, default=1, help="analysis processes in batch mode")
+    parser.add_argument("--format", choices=sorted(EMITTERS), default="json",
+                        help="output format: JSON, SQL DDL, OpenAPI skeleton or Markdown")
+    return parser.parse_args()
 
 if __name__ == "__main__":
-    run()
+    args = _parse_args()
+    if args.batch:
+        run_batch_mode(args.batch, workers=args.workers, fmt=args.format)
+    else:
+        run(fmt=args.format)
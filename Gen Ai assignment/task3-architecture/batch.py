@@ -0,0 +1,103 @@
+import json
+import sys
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from analyzer import analyze_architecture
+from emitters import render
+
+MEMO_SIZE = 4096
+
+
+def normalize_requirement(text: str) -> str:
+    return " ".join((text or "").lower().split())
+
+
+def analyze_normalized(normalized: str):
+    # the analyzer is case/whitespace-insensitive, so normalized text is a safe memo key
+    return analyze_architecture(normalized)
+
+
+def _parse_line(line: str, lineno: int) -> dict:
+    """
+    JSONL input line -> {"id", "requirement"}. Accepts {"id"?, "requirement" | "text"} objects or bare strings.
+    """
+    item = json.loads(line)
+    if isinstance(item, str):
+        return {"id": lineno, "requirement": item}
+    if not isinstance(item, dict):
+        raise ValueError("expected a JSON object or string")
+    text = item.get("requirement", item.get("text"))
+    if not isinstance(text, str):
+        raise ValueError('missing "requirement" text')
+    return {"id": item.get("id", lineno), "requirement": text}
+
+
+def run_batch(infile=None, outfile=None, workers: int = 1, chunk_size: int = 512, memo_size: int = MEMO_SIZE,
+              fmt: str = "json") -> dict:
+    """
+    Stream requirements as JSONL from infile (default stdin) to architectures as JSONL on outfile
+    (default stdout), in input order: {"id", "requirement", "architecture"} or {"id", "error"}.
+    With another fmt (see emitters.EMITTERS) the rendered text is in "output" instead of "architecture".
+
+    Input is read chunk by chunk, so memory stays flat for any backlog size. Repeated requirements
+    (after normalization) are served from an LRU memo in this process; the rest of a chunk is
+    analyzed in a process pool when workers > 1. Returns counters for the run.
+    """
+    infile = infile or sys.stdin
+    outfile = outfile or sys.stdout
+    memo = OrderedDict()
+    stats = {"items": 0, "analyzed": 0, "memo_hits": 0, "errors": 0}
+    pool = ProcessPoolExecutor(max_workers=workers) if workers > 1 else None
+
+    try:
+        lineno = 0
+        while True:
+            lines = list(islice(infile, chunk_size))
+            if not lines:
+                break
+
+            items = []
+            for line in lines:
+                lineno += 1
+                if not line.strip():
+                    continue
+                try:
+                    item = _parse_line(line, lineno)
+                    item["key"] = normalize_requirement(item["requirement"])
+                except ValueError as e:  # json.JSONDecodeError is a ValueError too
+                    item = {"id": lineno, "error": str(e)}
+                items.append(item)
+
+            misses = list(dict.fromkeys(i["key"] for i in items if "key" in i and i["key"] not in memo))
+            if pool is not None and len(misses) > 1:
+                results = pool.map(analyze_normalized, misses, chunksize=max(1, len(misses) // (workers * 4)))
+            else:
+                results = map(analyze_normalized, misses)
+            for key, result in zip(misses, results):
+                memo[key] = result
+            stats["analyzed"] += len(misses)
+            stats["memo_hits"] += sum(1 for i in items if "key" in i) - len(misses)
+
+            for item in items:
+                stats["items"] += 1
+                if "error" in item:
+                    stats["errors"] += 1
+                    outfile.write(json.dumps(item, ensure_ascii=False) + "\n")
+                    continue
+                key = item.pop("key")
+                memo.move_to_end(key)
+                if fmt == "json":
+                    item["architecture"] = memo[key].to_dict()
+                else:
+                    item["output"] = render(memo[key], fmt)
+                outfile.write(json.dumps(item, ensure_ascii=False) + "\n")
+
+            while len(memo) > memo_size:
+                memo.popitem(last=False)
+            outfile.flush()
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return stats
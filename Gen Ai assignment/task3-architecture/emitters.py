@@ -0,0 +1,119 @@
+import json
+import re
+from functools import lru_cache
+
+from models import Architecture
+
+CACHE_SIZE = 1024
+
+_JSON_TYPES = {
+    "INTEGER": {"type": "integer"},
+    "NUMERIC": {"type": "number"},
+    "REAL": {"type": "number"},
+    "TIMESTAMP": {"type": "string", "format": "date-time"},
+    "DATE": {"type": "string", "format": "date"},
+    "TEXT": {"type": "string"},
+}
+
+_PATH_PARAM = re.compile(r"\{(\w+)\}")
+
+
+def _ordered_tables(arch: Architecture) -> list:
+    """
+    Referenced tables first, so the DDL runs top to bottom on databases that check foreign keys.
+    """
+    pending, done, ordered = list(arch.tables), set(), []
+    while pending:
+        ready = [t for t in pending if all(c.references in done or c.references in (None, t.name)
+                                           for c in t.columns)] or pending[:1]
+        for t in ready:
+            pending.remove(t)
+            done.add(t.name)
+            ordered.append(t)
+    return ordered
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def to_json(arch: Architecture) -> str:
+    return json.dumps(arch.to_dict(), indent=2)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def to_sql(arch: Architecture) -> str:
+    has_id = {t.name for t in arch.tables if any(c.name == "id" for c in t.columns)}
+    statements = []
+    for table in _ordered_tables(arch):
+        lines = []
+        for c in table.columns:
+            line = f"    {c.name} {c.type}"
+            if c.primary_key:
+                line += " PRIMARY KEY"
+            elif c.references in has_id:
+                line += f" REFERENCES {c.references}(id)"
+            lines.append(line)
+        statements.append(f"CREATE TABLE {table.name} (\n" + ",\n".join(lines) + "\n);")
+    return "\n\n".join(statements) + "\n"
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def to_openapi(arch: Architecture) -> str:
+    """
+    OpenAPI 3 skeleton (JSON): one operation per API, one schema per table.
+    """
+    title = " + ".join(arch.domains) or "generic"
+    paths = {}
+    for api in arch.apis:
+        operation = {
+            "summary": f"{api.method} {api.path}",
+            "operationId": re.sub(r"\W+", "_", f"{api.method.lower()}{api.path}").strip("_"),
+            "responses": {"200": {"description": "OK"}},
+        }
+        params = [{"name": p, "in": "path", "required": True, "schema": {"type": "string"}}
+                  for p in _PATH_PARAM.findall(api.path)]
+        if params:
+            operation["parameters"] = params
+        if api.method in ("POST", "PUT", "PATCH"):
+            operation["requestBody"] = {"content": {"application/json": {"schema": {"type": "object"}}}}
+        paths.setdefault(api.path, {})[api.method.lower()] = operation
+
+    schemas = {
+        t.name: {"type": "object", "properties": {c.name: dict(_JSON_TYPES.get(c.type, {"type": "string"}))
+                                                  for c in t.columns}}
+        for t in arch.tables
+    }
+    spec = {
+        "openapi": "3.0.3",
+        "info": {"title": f"{title} API", "version": "0.1.0"},
+        "paths": paths,
+        "components": {"schemas": schemas},
+    }
+    return json.dumps(spec, indent=2)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def to_markdown(arch: Architecture) -> str:
+    out = [f"# Architecture: {' + '.join(arch.domains) or 'generic'}", "", "## Modules"]
+    out += [f"- {m}" for m in arch.modules]
+    out += ["", "## APIs", "", "| Method | Path |", "| --- | --- |"]
+    out += [f"| {a.method} | `{a.path}` |" for a in arch.apis]
+    out += ["", "## Database"]
+    for t in arch.tables:
+        out += ["", f"### {t.name}", "", "| Column | Type | Key |", "| --- | --- | --- |"]
+        for c in t.columns:
+            key = "PK" if c.primary_key else (f"FK → {c.references}" if c.references else "")
+            out.append(f"| {c.name} | {c.type} | {key} |")
+    out += ["", "## Pseudocode"]
+    out += [f"{i}. {step}" for i, step in enumerate(arch.pseudocode, 1)]
+    return "\n".join(out) + "\n"
+
+
+EMITTERS = {"json": to_json, "sql": to_sql, "openapi": to_openapi, "markdown": to_markdown}
+
+EXTENSIONS = {"json": "json", "sql": "sql", "openapi": "openapi.json", "markdown": "md"}
+
+
+def render(arch: Architecture, fmt: str = "json") -> str:
+    emit = EMITTERS.get(fmt)
+    if emit is None:
+        raise ValueError(f"unknown format {fmt!r} (choose from {', '.join(EMITTERS)})")
+    return emit(arch)
@@ -0,0 +1,147 @@
+import re
+from dataclasses import dataclass
+
+_TABLE = re.compile(r"^\s*(\w+)\s*\((.*)\)\s*$")
+_ENDPOINT = re.compile(r"^\s*([A-Za-z]+)\s+(\S+)\s*$")
+
+# column name -> SQL type, first match wins
+_TYPE_RULES = (
+    (re.compile(r"^(id|.*_id)$"), "INTEGER"),
+    (re.compile(r"^(price|total|amount|balance|value|net_pay)$"), "NUMERIC"),
+    (re.compile(r"^(lat|lng|score)$"), "REAL"),
+    (re.compile(r"^(quantity|capacity|duration)$"), "INTEGER"),
+    (re.compile(r"(_at|^timestamp|_time)$"), "TIMESTAMP"),
+    (re.compile(r"(_date|^date_of_birth|^day)$"), "DATE"),
+)
+
+
+def column_type(name: str) -> str:
+    for pattern, sql_type in _TYPE_RULES:
+        if pattern.search(name):
+            return sql_type
+    return "TEXT"
+
+
+@dataclass(frozen=True)
+class Column:
+    name: str
+    type: str = "TEXT"
+    primary_key: bool = False
+    references: str = None  # referenced table name, for *_id columns that match a table
+
+    def __str__(self):
+        return self.name
+
+
+@dataclass(frozen=True)
+class Table:
+    name: str
+    columns: tuple
+
+    @classmethod
+    def parse(cls, spec: str) -> "Table":
+        """
+        "Orders(id, user_id, total)" -> Table with typed columns (references are linked by Architecture).
+        """
+        m = _TABLE.match(spec)
+        if not m:
+            raise ValueError(f"bad table definition: {spec!r}")
+        names = [c.strip() for c in m.group(2).split(",") if c.strip()]
+        return cls(m.group(1), tuple(Column(n, column_type(n), n == "id") for n in names))
+
+    def merged(self, other: "Table") -> "Table":
+        names = {c.name for c in self.columns}
+        return Table(self.name, self.columns + tuple(c for c in other.columns if c.name not in names))
+
+    def __str__(self):
+        return f"{self.name}({', '.join(c.name for c in self.columns)})"
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    method: str
+    path: str
+
+    @classmethod
+    def parse(cls, spec: str) -> "Endpoint":
+        m = _ENDPOINT.match(spec)
+        if not m:
+            raise ValueError(f"bad API definition: {spec!r}")
+        return cls(m.group(1).upper(), m.group(2))
+
+    def __str__(self):
+        return f"{self.method} {self.path}"
+
+
+def _link_references(tables: tuple) -> tuple:
+    """
+    Point "user_id" at Users / User, "order_id" at Orders, ... when such a table exists.
+    """
+    by_singular = {}
+    for t in tables:
+        lower = t.name.lower()
+        by_singular.setdefault(lower[:-1] if lower.endswith("s") else lower, t.name)
+        by_singular.setdefault(lower, t.name)
+
+    linked = []
+    for t in tables:
+        columns = []
+        for c in t.columns:
+            target = by_singular.get(c.name[:-3].replace("_", "")) if c.name.endswith("_id") else None
+            columns.append(Column(c.name, c.type, c.primary_key, target))
+        linked.append(Table(t.name, tuple(columns)))
+    return tuple(linked)
+
+
+@dataclass(frozen=True)
+class Architecture:
+    """
+    Immutable, hashable architecture: safe to share between callers and to use as a cache key.
+    """
+    domains: tuple
+    modules: tuple
+    apis: tuple
+    tables: tuple
+    pseudocode: tuple
+
+    @classmethod
+    def from_template(cls, template: dict, domains: tuple = ()) -> "Architecture":
+        return cls(
+            domains=tuple(domains),
+            modules=tuple(template["modules"]),
+            apis=tuple(Endpoint.parse(a) for a in template["apis"]),
+            tables=_link_references(tuple(Table.parse(t) for t in template["database"])),
+            pseudocode=tuple(template["pseudocode"]),
+        )
+
+    @classmethod
+    def merge(cls, parts) -> "Architecture":
+        """
+        Concatenate several architectures in order without duplicates; same-name tables are merged column-wise.
+        """
+        def unique(items):
+            return tuple(dict.fromkeys(items))
+
+        tables = {}
+        for part in parts:
+            for t in part.tables:
+                tables[t.name] = tables[t.name].merged(t) if t.name in tables else t
+        return cls(
+            domains=unique(d for p in parts for d in p.domains),
+            modules=unique(m for p in parts for m in p.modules),
+            apis=unique(a for p in parts for a in p.apis),
+            tables=_link_references(tuple(tables.values())),
+            pseudocode=unique(s for p in parts for s in p.pseudocode),
+        )
+
+    def to_dict(self) -> dict:
+        """
+        Fresh plain-dict copy in the original output format (tables/APIs as strings).
+        """
+        return {
+            "domains": list(self.domains),
+            "modules": list(self.modules),
+            "apis": [str(a) for a in self.apis],
+            "database": [str(t) for t in self.tables],
+            "pseudocode": list(self.pseudocode),
+        }
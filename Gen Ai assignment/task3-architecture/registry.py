@@ -0,0 +1,111 @@
+import math
+import re
+
+from models import Architecture
+from templates import GENERIC_TEMPLATE, TEMPLATES
+
+MERGE_CACHE_SIZE = 4096
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def _stem(word: str) -> str:
+    # just enough folding for "payments" / "chats" / "bookings" to hit their keyword
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+def tokenize(text: str) -> list[str]:
+    return [_stem(w) for w in _WORD.findall((text or "").lower())]
+
+
+class TemplateRegistry:
+    """
+    Domain templates plus an inverted index {keyword phrase (as a token tuple): [(domain, weight)]}
+    built once. Matching looks up each 1..n-gram of the requirement in the index, so its cost
+    depends on the requirement length, not on how many templates are registered.
+
+    Weights come from the template files, scaled by 1 + log(N / df) so phrases shared by many
+    domains ("support", "order") count for less than distinctive ones ("payroll").
+
+    Every template is also compiled once into an immutable models.Architecture; merged
+    combinations are cached, so repeated matches never re-parse or rebuild anything.
+    """
+
+    def __init__(self, templates: dict = None):
+        self.templates = TEMPLATES if templates is None else templates
+        self.index = {}
+        self.max_phrase = 1
+        self.compiled = {name: Architecture.from_template(t, (name,)) for name, t in self.templates.items()}
+        self._generic = Architecture.from_template(GENERIC_TEMPLATE)
+        self._merged = {}
+
+        postings = {}
+        for name, template in self.templates.items():
+            for phrase, weight in template["keywords"].items():
+                key = tuple(tokenize(phrase))
+                if key:
+                    domains = postings.setdefault(key, {})
+                    domains[name] = max(float(weight), domains.get(name, 0.0))
+        n = max(1, len(self.templates))
+        for key, domains in postings.items():
+            idf = 1 + math.log(n / len(domains))
+            self.index[key] = [(name, weight * idf) for name, weight in domains.items()]
+            self.max_phrase = max(self.max_phrase, len(key))
+
+    def score(self, text: str) -> dict:
+        """
+        {domain: score} for every domain with at least one keyword in text; each phrase counts once.
+        """
+        tokens = tokenize(text)
+        seen, scores = set(), {}
+        for size in range(1, self.max_phrase + 1):
+            for i in range(len(tokens) - size + 1):
+                key = tuple(tokens[i:i + size])
+                if key in seen:
+                    continue
+                seen.add(key)
+                for name, weight in self.index.get(key, ()):
+                    scores[name] = scores.get(name, 0.0) + weight
+        return scores
+
+    def match(self, text: str, limit: int = 3, min_score: float = 1.0, ratio: float = 0.25) -> list[tuple]:
+        """
+        [(domain, score)] best first: at most `limit` domains scoring >= min_score and
+        >= ratio * the best score (so one stray word does not drag in a whole domain).
+        """
+        ranked = sorted(self.score(text).items(), key=lambda kv: (-kv[1], kv[0]))
+        if not ranked:
+            return []
+        floor = max(min_score, ranked[0][1] * ratio)
+        return [(name, round(s, 3)) for name, s in ranked[:limit] if s >= floor]
+
+    def merge(self, names) -> Architecture:
+        """
+        One architecture from several domains (in the given order): sections deduplicated,
+        same-name tables merged column-wise. Cached per combination.
+        """
+        key = tuple(names)
+        merged = self._merged.get(key)
+        if merged is None:
+            if len(self._merged) >= MERGE_CACHE_SIZE:
+                self._merged.clear()
+            merged = self._merged[key] = Architecture.merge([self.compiled[n] for n in key])
+        return merged
+
+    def generic(self) -> Architecture:
+        return self._generic
+
+
+_default = None
+
+
+def get_registry() -> TemplateRegistry:
+    """
+    Process-wide registry over templates.TEMPLATES, built on first use.
+    """
+    global _default
+    if _default is None:
+        _default = TemplateRegistry()
+    return _default
@@ -1,49 +1,35 @@
-TEMPLATES = {
-    "chatbot": {
-        "modules": [
-            "Frontend UI",
-            "Chat Controller",
-            "AI Response Engine",
-            "Database Layer"
-        ],
-        "apis": [
-            "POST /chat",
-            "GET /chat/history"
-        ],
-        "database": [
-            "Users(id, name, email)",
-            "Messages(id, user_id, message, response, timestamp)"
-        ],
-        "pseudocode": [
-            "Receive user message",
-            "Send message to AI engine",
-            "Store response in database",
-            "Return response to UI"
-        ]
-    },
+import glob
+import json
+import os
 
-    "ecommerce": {
-        "modules": [
-            "Product Service",
-            "Order Service",
-            "Payment Service",
-            "User Service"
-        ],
-        "apis": [
-            "GET /products",
-            "POST /order",
-            "POST /payment"
-        ],
-        "database": [
-            "Products(id, name, price)",
-            "Orders(id, user_id, total)",
-            "Payments(id, order_id, status)"
-        ],
-        "pseudocode": [
-            "Fetch product list",
-            "Create order",
-            "Process payment",
-            "Confirm order"
-        ]
-    }
+# one JSON file per domain: {"name", "keywords": {phrase: weight}, "modules", "apis", "database", "pseudocode"}
+DOMAINS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "domains")
+
+SECTIONS = ("modules", "apis", "database", "pseudocode")
+
+GENERIC_TEMPLATE = {
+    "modules": ["Frontend", "Backend", "Database"],
+    "apis": ["POST /api"],
+    "database": ["GenericTable(id, data)"],
+    "pseudocode": ["Process request", "Return response"]
 }
+
+
+def load_templates(domains_dir: str = DOMAINS_DIR) -> dict:
+    """
+    {domain name: template} from every *.json file in domains_dir (file name is the default name).
+    Adding a domain is a matter of dropping a file in; no code changes.
+    """
+    templates = {}
+    for path in sorted(glob.glob(os.path.join(domains_dir, "*.json"))):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        name = data.get("name") or os.path.splitext(os.path.basename(path))[0]
+        missing = [s for s in SECTIONS if s not in data]
+        if missing or not data.get("keywords"):
+            raise ValueError(f"{path}: domain template needs keywords and {', '.join(SECTIONS)}")
+        templates[name] = data
+    return templates
+
+
+TEMPLATES = load_templates()